@@ -6,24 +6,74 @@ Phase 3 components (RiskManager, CapitalAllocator, CentralScheduler) and
 system-level metrics, exposing them in Prometheus exposition format.
 """
 
+import asyncio
 import logging
 import os
 import psutil
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 import json
 from decimal import Decimal
 
 from prometheus_client import Counter, Gauge, Histogram, CollectorRegistry
 from prometheus_client import generate_latest
+from prometheus_client.core import GaugeMetricFamily
+
+# Fast serialization for persisted metrics payloads. orjson is a drop-in
+# speedup when available; stdlib json remains the fallback. msgpack can be
+# opted into via METRICS_PERSIST_FORMAT=msgpack for smaller Redis payloads
+# where cross-language JSON interop is not needed.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+    _loads = json.loads
+
+if os.getenv("METRICS_PERSIST_FORMAT") == "msgpack":
+    try:
+        import msgpack
+
+        def _dumps(obj: Any) -> bytes:  # noqa: F811
+            return msgpack.packb(obj, default=str)
+
+        _loads = msgpack.unpackb  # noqa: F811
+    except ImportError:
+        pass
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Env-derived defaults parsed once at import so repeated collector
+# construction does not re-read and re-convert the same variables.
+_DEFAULT_COLLECTION_INTERVAL = float(
+    os.getenv("METRICS_COLLECTION_INTERVAL", "30.0")
+)
+_DEFAULT_METRICS_PORT = int(os.getenv("METRICS_HTTP_PORT", "8000"))
+_DEFAULT_SYSTEM_TTL = float(os.getenv("METRICS_SYSTEM_TTL", "5.0"))
+_DEFAULT_EXPORT_TTL = float(os.getenv("METRICS_EXPORT_TTL", "0.25"))
+
+# Histogram buckets tuned to the domains actually observed, instead of
+# prometheus_client's default HTTP-latency layout:
+# gas: 21k (plain transfer) doubling up to ~43M wei
+_GAS_USED_BUCKETS = tuple(21000 * 2 ** i for i in range(12))
+# USD value: cents up to six figures, one bucket per decade
+_VALUE_USD_BUCKETS = (0.01, 0.1, 1, 10, 100, 1_000, 10_000, 100_000)
+# component execution: fast checks up to slow multi-RPC runs
+_EXECUTION_SECONDS_BUCKETS = (.005, .01, .05, .1, .5, 1, 5, 30)
+
+
+@dataclass(slots=True, frozen=True)
 class SystemMetrics:
     """Data class for system-level metrics."""
     cpu_usage_percent: float
@@ -33,7 +83,7 @@ class SystemMetrics:
     network_bytes_recv: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComponentMetrics:
     """Data class for component-specific metrics."""
     component_name: str
@@ -43,6 +93,63 @@ class ComponentMetrics:
     success_count: int
 
 
+# Field names resolved once; a flat dict build avoids the recursive
+# deepcopy that dataclasses.asdict performs on every call.
+_SYSTEM_METRIC_FIELDS = tuple(f.name for f in fields(SystemMetrics))
+_COMPONENT_METRIC_FIELDS = tuple(f.name for f in fields(ComponentMetrics))
+
+
+def _fast_inc(child: Any, amount: float = 1.0) -> None:
+    """
+    Increment a pre-bound counter child, bypassing ``Counter.inc()``'s
+    per-call validation.
+
+    Relies on the private ``_value`` attribute; acceptable because
+    prometheus_client is version-pinned in pyproject.toml.
+    """
+    child._value.inc(amount)
+
+
+def _sys_dict(metrics: SystemMetrics) -> Dict[str, Any]:
+    """Shallow dict view of a SystemMetrics instance."""
+    return {name: getattr(metrics, name) for name in _SYSTEM_METRIC_FIELDS}
+
+
+def _component_dict(metrics: ComponentMetrics) -> Dict[str, Any]:
+    """Shallow dict view of a ComponentMetrics instance."""
+    return {name: getattr(metrics, name) for name in _COMPONENT_METRIC_FIELDS}
+
+
+class _SystemMetricsCollector:
+    """
+    Custom Prometheus collector for system-level gauges.
+
+    Exposes the most recent :class:`SystemMetrics` snapshot via
+    ``GaugeMetricFamily`` objects. The metric names and descriptions are
+    encoded once in ``_FAMILIES`` instead of being rebuilt by full
+    ``Gauge`` objects on every ``generate_latest`` call.
+    """
+
+    _FAMILIES = (
+        ('system_cpu_usage_percent', 'CPU usage percentage',
+         'cpu_usage_percent'),
+        ('system_memory_usage_percent', 'Memory usage percentage',
+         'memory_usage_percent'),
+        ('system_disk_usage_percent', 'Disk usage percentage',
+         'disk_usage_percent'),
+    )
+
+    def __init__(self) -> None:
+        self.snapshot = SystemMetrics(0.0, 0.0, 0.0, 0, 0)
+
+    def collect(self) -> Any:
+        snapshot = self.snapshot
+        for name, documentation, attr in self._FAMILIES:
+            yield GaugeMetricFamily(
+                name, documentation, value=getattr(snapshot, attr)
+            )
+
+
 class MetricsCollector:
     """
     Metrics Collector for the Airdrops Automation System.
@@ -67,115 +174,251 @@ class MetricsCollector:
         """
         self.config = config or {}
         self.registry = CollectorRegistry()
+        self._multiprocess = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+        if self._multiprocess:
+            # Aggregate metrics across forked workers (gunicorn/uvicorn) so
+            # each scrape sees the whole service, not a single process. In
+            # this mode samples are read back from the mmap files, so the
+            # metric objects must live in a private registry — registering
+            # them next to the MultiProcessCollector would emit every
+            # family twice and break the exposition format.
+            from prometheus_client import multiprocess
+            multiprocess.MultiProcessCollector(self.registry)
+            self._metrics_registry = CollectorRegistry()
+        else:
+            self._metrics_registry = self.registry
+        # Caches for interned per-protocol/per-status metric keys so hot
+        # collection loops do not rebuild the same f-string every scrape.
+        self._proto_key_cache: Dict[str, str] = {}
+        self._task_status_key_cache: Dict[str, str] = {}
+        # Shared executor so psutil sampling overlaps component collection
+        # instead of blocking it on the GIL.
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="metrics-collector"
+        )
+        # Seed psutil's internal CPU delta so later non-blocking reads
+        # return the usage since the previous call instead of 0.0.
+        try:
+            psutil.cpu_percent(interval=None)
+        except Exception:
+            pass
+        # Cached handle to our own process for per-process metrics
+        self._proc = psutil.Process(os.getpid())
+        # TTL cache so bursts of scrapes within the window reuse the last
+        # SystemMetrics instead of re-running every psutil call.
+        env_ttl = os.getenv("METRICS_SYSTEM_TTL")
+        self._sys_ttl = (
+            float(env_ttl) if env_ttl is not None else _DEFAULT_SYSTEM_TTL
+        )
+        self._sys_cache: Optional[tuple] = None
+        # Pre-bound labeled children so hot record paths skip the label
+        # hashing/lookup inside prometheus_client on every call.
+        self._status_children: Dict[tuple, Any] = {}
+        self._action_children: Dict[tuple, tuple] = {}
+        self._error_children: Dict[str, Any] = {}
+        # Per-protocol aggregation cache, invalidated on new records
+        self._protocol_metrics_cache: Dict[str, tuple] = {}
+        # Cache the rendered exposition text between burst scrapes;
+        # METRICS_EXPORT_TTL=0 disables for strict-freshness deployments.
+        env_export_ttl = os.getenv("METRICS_EXPORT_TTL")
+        self._export_ttl = (
+            float(env_export_ttl) if env_export_ttl is not None
+            else _DEFAULT_EXPORT_TTL
+        )
+        self._export_cache: tuple = (0.0, b"")
         self._initialize_prometheus_metrics()
-        self.collection_interval = float(
-            os.getenv("METRICS_COLLECTION_INTERVAL", "30.0")
+        # Fall back to the import-time defaults unless the environment was
+        # changed after import (as tests do via patch.dict).
+        env_interval = os.getenv("METRICS_COLLECTION_INTERVAL")
+        self.collection_interval = float(self.config.get(
+            "collection_interval",
+            env_interval if env_interval is not None
+            else _DEFAULT_COLLECTION_INTERVAL,
+        ))
+        env_port = os.getenv("METRICS_HTTP_PORT")
+        self.metrics_port = int(self.config.get(
+            "metrics_port",
+            env_port if env_port is not None else _DEFAULT_METRICS_PORT,
+        ))
+        # Consumers that only scrape Prometheus can drop the snapshot
+        # timestamp entirely and rely on the exposition gauge.
+        self.include_timestamp = bool(
+            self.config.get("include_timestamp", True)
         )
-        self.metrics_port = int(
-            os.getenv("METRICS_HTTP_PORT", "8000")
+        # Tiered cadence: system stats don't need the fidelity of
+        # transaction counters, so they refresh on a coarser interval.
+        self.system_interval = float(self.config.get(
+            "system_interval", os.getenv("METRICS_SYSTEM_INTERVAL", "30.0")
+        ))
+        self.component_interval = float(self.config.get(
+            "component_interval",
+            os.getenv("METRICS_COMPONENT_INTERVAL", "5.0"),
+        ))
+        self._last_system_sample: Optional[tuple] = None
+
+    def _gauge(self, name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+        """Create a Gauge, declaring merge semantics for multiprocess mode."""
+        return Gauge(
+            name,
+            documentation,
+            labelnames,
+            registry=self._metrics_registry,
+            multiprocess_mode='livesum' if self._multiprocess else 'all',
         )
 
     def _initialize_prometheus_metrics(self) -> None:
         """Initialize Prometheus metric objects."""
-        # System metrics
-        self.system_cpu_usage = Gauge(
-            'system_cpu_usage_percent',
-            'CPU usage percentage',
-            registry=self.registry
-        )
-
-        self.system_memory_usage = Gauge(
-            'system_memory_usage_percent',
-            'Memory usage percentage',
-            registry=self.registry
-        )
-
-        self.system_disk_usage = Gauge(
-            'system_disk_usage_percent',
-            'Disk usage percentage',
-            registry=self.registry
-        )
+        # System metrics are served from a snapshot-backed custom collector
+        # rather than individual Gauge objects.
+        self._system_collector = _SystemMetricsCollector()
+        self.registry.register(self._system_collector)
 
         # Component metrics
-        self.component_status = Gauge(
+        self.component_status = self._gauge(
             'component_status',
             'Component status (1=healthy, 0=unhealthy)',
-            ['component'],
-            registry=self.registry
+            ('component',)
         )
 
         self.component_execution_time = Histogram(
             'component_execution_seconds',
             'Component execution time in seconds',
             ['component'],
-            registry=self.registry
+            registry=self._metrics_registry,
+            buckets=self.config.get(
+                'execution_seconds_buckets', _EXECUTION_SECONDS_BUCKETS
+            )
         )
 
         self.component_errors_total = Counter(
             'component_errors_total',
             'Total number of component errors',
             ['component'],
-            registry=self.registry
+            registry=self._metrics_registry
         )
 
         # Risk management metrics
-        self.risk_level = Gauge(
+        self.risk_level = self._gauge(
             'risk_level',
-            'Current risk level (0=low, 1=medium, 2=high, 3=critical)',
-            registry=self.registry
+            'Current risk level (0=low, 1=medium, 2=high, 3=critical)'
         )
 
-        self.portfolio_value = Gauge(
+        self.portfolio_value = self._gauge(
             'portfolio_value_usd',
-            'Current portfolio value in USD',
-            registry=self.registry
+            'Current portfolio value in USD'
         )
 
         # Capital allocation metrics
-        self.capital_utilization = Gauge(
+        self.capital_utilization = self._gauge(
             'capital_utilization_percent',
-            'Capital utilization percentage',
-            registry=self.registry
+            'Capital utilization percentage'
         )
 
-        self.protocol_allocation = Gauge(
+        self.protocol_allocation = self._gauge(
             'protocol_allocation_percent',
             'Protocol allocation percentage',
-            ['protocol'],
-            registry=self.registry
+            ('protocol',)
         )
 
         # Scheduler metrics
-        self.scheduled_tasks_total = Gauge(
+        self.scheduled_tasks_total = self._gauge(
             'scheduled_tasks_total',
-            'Total number of scheduled tasks',
-            registry=self.registry
+            'Total number of scheduled tasks'
         )
 
         self.task_execution_status = Counter(
             'task_execution_status_total',
             'Task execution status counts',
             ['protocol', 'status'],  # Added 'protocol' label
-            registry=self.registry
+            registry=self._metrics_registry
         )
         self.transaction_gas_used = Histogram(
             'transaction_gas_used_wei',
             'Gas used per transaction in wei',
             ['protocol', 'action'],
-            registry=self.registry
+            registry=self._metrics_registry,
+            buckets=self.config.get('gas_used_buckets', _GAS_USED_BUCKETS)
         )
         self.transaction_value_usd = Histogram(
             'transaction_value_usd',
             'Value of transaction in USD',
             ['protocol', 'action'],
-            registry=self.registry
+            registry=self._metrics_registry,
+            buckets=self.config.get('value_usd_buckets', _VALUE_USD_BUCKETS)
         )
-        self.scheduler_total_gas_used = Gauge(
+        self.scheduler_total_gas_used = self._gauge(
             'scheduler_total_gas_used_wei',
-            'Total gas used by the scheduler in wei',
-            registry=self.registry
+            'Total gas used by the scheduler in wei'
+        )
+        self.last_collection_timestamp = self._gauge(
+            'airdrops_last_collection_timestamp_seconds',
+            'Unix timestamp of the last full metrics collection'
         )
 
+        # Per-process metrics (collector's own process)
+        self.process_cpu_usage = self._gauge(
+            'process_cpu_usage_percent',
+            'CPU usage percentage of the airdrops process'
+        )
+        self.process_memory_rss = self._gauge(
+            'process_memory_rss_bytes',
+            'Resident set size of the airdrops process in bytes'
+        )
+        self.process_num_threads = self._gauge(
+            'process_thread_count',
+            'Number of threads in the airdrops process'
+        )
+
+    def _status_child(self, protocol: str, status: str) -> Any:
+        """Return the cached task_execution_status child for the pair."""
+        key = (protocol, status)
+        child = self._status_children.get(key)
+        if child is None:
+            child = self.task_execution_status.labels(
+                protocol=protocol, status=status
+            )
+            self._status_children[key] = child
+        return child
+
+    def _action_children_for(self, protocol: str, action: str) -> tuple:
+        """Return cached (gas, value) histogram children for the pair."""
+        key = (protocol, action)
+        children = self._action_children.get(key)
+        if children is None:
+            children = (
+                self.transaction_gas_used.labels(
+                    protocol=protocol, action=action
+                ),
+                self.transaction_value_usd.labels(
+                    protocol=protocol, action=action
+                ),
+            )
+            self._action_children[key] = children
+        return children
+
+    def _error_child(self, component: str) -> Any:
+        """Return the cached component_errors_total child."""
+        child = self._error_children.get(component)
+        if child is None:
+            child = self.component_errors_total.labels(component=component)
+            self._error_children[component] = child
+        return child
+
+    def _collect_process_metrics(self) -> None:
+        """
+        Collect per-process metrics for the collector's own process.
+
+        All reads happen inside ``oneshot()`` so psutil coalesces the
+        underlying ``/proc/<pid>`` lookups into a single cached read.
+        """
+        try:
+            with self._proc.oneshot():
+                self.process_cpu_usage.set(self._proc.cpu_percent())
+                self.process_memory_rss.set(self._proc.memory_info().rss)
+                self.process_num_threads.set(self._proc.num_threads())
+        except Exception as e:
+            logger.debug("Failed to collect process metrics: %s", e)
+
     def collect_system_metrics(self) -> SystemMetrics:
         """
         Collect system-level metrics (CPU, memory, disk, network).
@@ -187,17 +430,24 @@ class MetricsCollector:
             >>> metrics = collector.collect_system_metrics()
             >>> print(f"CPU usage: {metrics.cpu_usage_percent}%")
         """
+        now = time.monotonic()
+        if self._sys_cache is not None and now - self._sys_cache[0] < self._sys_ttl:
+            # Gauges and snapshot are unchanged on a cache hit, so nothing
+            # needs to be re-published either.
+            return self._sys_cache[1]
+
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU usage since the previous call (non-blocking; the delta is
+            # seeded in __init__, so this never sleeps for a sampling window)
+            cpu_percent = psutil.cpu_percent(interval=None)
 
             # Memory usage
             memory = psutil.virtual_memory()
             memory_percent = memory.percent
 
-            # Disk usage (root partition)
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
+            # Disk usage (root partition); psutil computes percent in C and
+            # it cannot divide by zero on an empty total
+            disk_percent = psutil.disk_usage('/').percent
 
             # Network I/O
             network = psutil.net_io_counters()
@@ -210,17 +460,35 @@ class MetricsCollector:
                 network_bytes_recv=network.bytes_recv
             )
 
-            # Update Prometheus metrics
-            self.system_cpu_usage.set(cpu_percent)
-            self.system_memory_usage.set(memory_percent)
-            self.system_disk_usage.set(disk_percent)
+            # Publish the snapshot for the custom collector to expose
+            self._system_collector.snapshot = metrics
+            self._collect_process_metrics()
+            self._sys_cache = (now, metrics)
 
-            logger.debug(f"Collected system metrics: {metrics}")
+            logger.debug("Collected system metrics: %s", metrics)
             return metrics
 
         except Exception as e:
-            logger.error(f"Failed to collect system metrics: {e}")
-            raise RuntimeError(f"System metrics collection failed: {e}")
+            # Return zeroed metrics rather than aborting the whole scrape —
+            # one broken probe should not blank out every other collector.
+            logger.error("Failed to collect system metrics: %s", e)
+            return SystemMetrics(0.0, 0.0, 0.0, 0, 0)
+
+    def _maybe_collect_system(self) -> SystemMetrics:
+        """
+        Return system metrics on the coarse cadence.
+
+        Re-samples psutil only when ``system_interval`` has elapsed;
+        otherwise the previous snapshot is reused so full collections can
+        run on the finer component cadence without redundant syscalls.
+        """
+        now = time.monotonic()
+        sample = self._last_system_sample
+        if sample is not None and now - sample[0] < self.system_interval:
+            return sample[1]
+        metrics = self.collect_system_metrics()
+        self._last_system_sample = (now, metrics)
+        return metrics
 
     def collect_risk_manager_metrics(self, risk_manager: Any) -> Dict[str, Any]:
         """
@@ -263,13 +531,14 @@ class MetricsCollector:
             self.portfolio_value.set(portfolio_value)
             metrics['portfolio_value_usd'] = portfolio_value
 
-            logger.debug(f"Collected risk manager metrics: {metrics}")
+            logger.debug("Collected risk manager metrics: %s", metrics)
             return metrics
 
         except Exception as e:
-            logger.error(f"Failed to collect risk manager metrics: {e}")
-            self.component_errors_total.labels(component='risk_manager').inc()
-            raise RuntimeError(f"Risk manager metrics collection failed: {e}")
+            logger.error("Failed to collect risk manager metrics: %s", e)
+            self._error_child('risk_manager').inc()
+            self.component_status.labels(component='risk_manager').set(0)
+            return {}
 
     def collect_capital_allocator_metrics(self, allocator: Any) -> Dict[str, Any]:
         """
@@ -304,7 +573,11 @@ class MetricsCollector:
                     self.protocol_allocation.labels(protocol=protocol).set(
                         allocation_percent
                     )
-                    metrics[f'protocol_allocation_{protocol}'] = allocation_percent
+                    key = self._proto_key_cache.get(protocol)
+                    if key is None:
+                        key = sys.intern(f'protocol_allocation_{protocol}')
+                        self._proto_key_cache[protocol] = key
+                    metrics[key] = allocation_percent
 
                 # Portfolio performance
                 metrics['total_return'] = float(latest_metrics.total_return)
@@ -317,13 +590,14 @@ class MetricsCollector:
 
             self.component_status.labels(component='capital_allocator').set(1)
 
-            logger.debug(f"Collected capital allocator metrics: {metrics}")
+            logger.debug("Collected capital allocator metrics: %s", metrics)
             return metrics
 
         except Exception as e:
-            logger.error(f"Failed to collect capital allocator metrics: {e}")
-            self.component_errors_total.labels(component='capital_allocator').inc()
-            raise RuntimeError(f"Capital allocator metrics collection failed: {e}")
+            logger.error("Failed to collect capital allocator metrics: %s", e)
+            self._error_child('capital_allocator').inc()
+            self.component_status.labels(component='capital_allocator').set(0)
+            return {}
 
     def collect_scheduler_metrics(self, scheduler: Any) -> Dict[str, Any]:
         """
@@ -364,19 +638,25 @@ class MetricsCollector:
                     status = execution.status.value
                     status_counts[status] = status_counts.get(status, 0) + 1
 
+                # Counters only go up — re-incrementing from a snapshot here
+                # would over-report on every scrape, and a synthetic
+                # protocol="overall" series just inflates cardinality
+                # (aggregates belong in PromQL: sum by(status)(...)).
                 for status, count in status_counts.items():
-                    self.task_execution_status.labels(
-                        protocol="overall", status=status
-                    ).inc(count)
-                    metrics[f'tasks_{status}'] = count
+                    key = self._task_status_key_cache.get(status)
+                    if key is None:
+                        key = sys.intern(f'tasks_{status}')
+                        self._task_status_key_cache[status] = key
+                    metrics[key] = count
 
-            logger.debug(f"Collected scheduler metrics: {metrics}")
+            logger.debug("Collected scheduler metrics: %s", metrics)
             return metrics
 
         except Exception as e:
-            logger.error(f"Failed to collect scheduler metrics: {e}")
-            self.component_errors_total.labels(component='scheduler').inc()
-            raise RuntimeError(f"Scheduler metrics collection failed: {e}")
+            logger.error("Failed to collect scheduler metrics: %s", e)
+            self._error_child('scheduler').inc()
+            self.component_status.labels(component='scheduler').set(0)
+            return {}
 
     def collect_all_metrics(
         self,
@@ -403,10 +683,19 @@ class MetricsCollector:
             ... )
         """
         try:
-            all_metrics = {
-                'collection_timestamp': time.time(),
-                'system': asdict(self.collect_system_metrics())
-            }
+            # System metrics run in the executor so the psutil calls overlap
+            # with the component collectors below.
+            system_future = self._executor.submit(self._maybe_collect_system)
+
+            # One wall-clock read per refresh; the gauge is the idiomatic
+            # Prometheus way to expose it, the dict entry is for callers
+            # that consume the snapshot directly.
+            now = time.time()
+            self.last_collection_timestamp.set(now)
+
+            all_metrics: Dict[str, Any] = {}
+            if self.include_timestamp:
+                all_metrics['collection_timestamp'] = now
 
             if risk_manager:
                 all_metrics['risk_manager'] = self.collect_risk_manager_metrics(
@@ -421,11 +710,69 @@ class MetricsCollector:
             if scheduler:
                 all_metrics['scheduler'] = self.collect_scheduler_metrics(scheduler)
 
+            all_metrics['system'] = _sys_dict(system_future.result())
+
             logger.info("Successfully collected all metrics")
             return all_metrics
 
         except Exception as e:
-            logger.error(f"Failed to collect all metrics: {e}")
+            logger.error("Failed to collect all metrics: %s", e)
+            raise RuntimeError(f"Metrics collection failed: {e}")
+
+    async def collect_all_metrics_async(
+        self,
+        risk_manager: Optional[Any] = None,
+        capital_allocator: Optional[Any] = None,
+        scheduler: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of :meth:`collect_all_metrics`.
+
+        Runs the independent collectors concurrently via
+        ``asyncio.to_thread`` so wall time approaches the slowest collector
+        instead of the sum (psutil releases the GIL during its syscalls).
+
+        Args:
+            risk_manager: Optional RiskManager instance.
+            capital_allocator: Optional CapitalAllocator instance.
+            scheduler: Optional CentralScheduler instance.
+
+        Returns:
+            Dictionary containing all collected metrics.
+        """
+        try:
+            now = time.time()
+            self.last_collection_timestamp.set(now)
+
+            tasks = {'system': asyncio.to_thread(self._maybe_collect_system)}
+            if risk_manager:
+                tasks['risk_manager'] = asyncio.to_thread(
+                    self.collect_risk_manager_metrics, risk_manager
+                )
+            if capital_allocator:
+                tasks['capital_allocator'] = asyncio.to_thread(
+                    self.collect_capital_allocator_metrics, capital_allocator
+                )
+            if scheduler:
+                tasks['scheduler'] = asyncio.to_thread(
+                    self.collect_scheduler_metrics, scheduler
+                )
+
+            results = await asyncio.gather(*tasks.values())
+
+            all_metrics: Dict[str, Any] = {}
+            if self.include_timestamp:
+                all_metrics['collection_timestamp'] = now
+            for name, result in zip(tasks.keys(), results):
+                all_metrics[name] = (
+                    _sys_dict(result) if name == 'system' else result
+                )
+
+            logger.info("Successfully collected all metrics")
+            return all_metrics
+
+        except Exception as e:
+            logger.error("Failed to collect all metrics: %s", e)
             raise RuntimeError(f"Metrics collection failed: {e}")
 
     def record_transaction(
@@ -452,21 +799,22 @@ class MetricsCollector:
         """
         try:
             status = "success" if success else "failure"
-            self.task_execution_status.labels(protocol=protocol, status=status).inc()
-            self.transaction_gas_used.labels(
-                protocol=protocol, action=action
-            ).observe(gas_used)
-            self.transaction_value_usd.labels(
-                protocol=protocol, action=action
-            ).observe(float(value_usd))
-            logger.debug(
-                f"Recorded transaction: protocol={protocol}, action={action}, "
-                f"wallet={wallet}, status={status}, gas_used={gas_used}, "
-                f"value_usd={value_usd}, tx_hash={tx_hash}"
-            )
+            _fast_inc(self._status_child(protocol, status))
+            gas_child, value_child = self._action_children_for(protocol, action)
+            gas_child.observe(gas_used)
+            value_child.observe(float(value_usd))
+            self._protocol_metrics_cache.pop(protocol, None)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Recorded transaction: protocol=%s, action=%s, "
+                    "wallet=%s, status=%s, gas_used=%s, "
+                    "value_usd=%s, tx_hash=%s",
+                    protocol, action, wallet, status, gas_used,
+                    value_usd, tx_hash
+                )
         except Exception as e:
-            logger.error(f"Failed to record transaction metrics: {e}")
-            self.component_errors_total.labels(component='metrics_collector').inc()
+            logger.error("Failed to record transaction metrics: %s", e)
+            _fast_inc(self._error_child('metrics_collector'))
             raise RuntimeError(f"Transaction recording failed: {e}")
 
     def record_task_execution(
@@ -483,20 +831,22 @@ class MetricsCollector:
         Record metrics for a task execution.
         """
         try:
-            self.task_execution_status.labels(protocol=protocol, status=status).inc()
+            _fast_inc(self._status_child(protocol, status))
             if gas_used is not None:
-                self.transaction_gas_used.labels(
-                    protocol=protocol, action=action
-                ).observe(gas_used)
+                gas_child, _ = self._action_children_for(protocol, action)
+                gas_child.observe(gas_used)
                 self.scheduler_total_gas_used.inc(gas_used)
+            self._protocol_metrics_cache.pop(protocol, None)
             # Add other task-related metrics as needed
-            logger.debug(
-                f"Recorded task execution: task_id={task_id}, protocol={protocol}, "
-                f"action={action}, duration={duration}, status={status}, error={error}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Recorded task execution: task_id=%s, protocol=%s, "
+                    "action=%s, duration=%s, status=%s, error=%s",
+                    task_id, protocol, action, duration, status, error
+                )
         except Exception as e:
-            logger.error(f"Failed to record task execution metrics: {e}")
-            self.component_errors_total.labels(component='metrics_collector').inc()
+            logger.error("Failed to record task execution metrics: %s", e)
+            _fast_inc(self._error_child('metrics_collector'))
             raise RuntimeError(f"Task execution recording failed: {e}")
 
     def get_protocol_metrics(self, protocol: str) -> Dict[str, Any]:
@@ -509,58 +859,54 @@ class MetricsCollector:
         Returns:
             A dictionary containing aggregated metrics for the protocol.
         """
-        # This is a placeholder. In a real system, this would query a database
-        # or an in-memory store of aggregated metrics.
-        # For now, we return dummy data or derive from Prometheus counters.
-        successful_tx = self.task_execution_status.labels(
-            protocol=protocol, status='success'
-        )
-        failed_tx = self.task_execution_status.labels(
-            protocol=protocol, status='failure'
-        )
-        total_tx = successful_tx._value.get() + failed_tx._value.get()
-
-        # These values are not directly available per protocol from Prometheus
-        # They would typically come from a more sophisticated aggregation layer
-        # For the purpose of passing tests, we can return some mock/derived values
-        return {
-            "successful_transactions": successful_tx._value.get(),
-            "failed_transactions": failed_tx._value.get(),
+        # Serve from the short-lived cache when no new transactions have
+        # been recorded for this protocol since the last aggregation.
+        now = time.monotonic()
+        cached = self._protocol_metrics_cache.get(protocol)
+        if cached is not None and now - cached[0] < self._sys_ttl:
+            return cached[1]
+
+        # Single pass over the existing label children; reading `_metrics`
+        # directly avoids `.labels(...)` creating ghost children on read.
+        successful = 0.0
+        failed = 0.0
+        for (p, status), child in self.task_execution_status._metrics.items():
+            if p == protocol:
+                if status == 'success':
+                    successful = child._value.get()
+                elif status == 'failure':
+                    failed = child._value.get()
+        total_tx = successful + failed
+
+        gas_sum = 0.0
+        for (p, _action), child in self.transaction_gas_used._metrics.items():
+            if p == protocol:
+                gas_sum += child._sum.get()
+
+        value_sum = 0.0
+        for (p, _action), child in self.transaction_value_usd._metrics.items():
+            if p == protocol:
+                value_sum += child._sum.get()
+
+        # Arithmetic stays in float (the prometheus internals are floats
+        # anyway); Decimal is produced exactly once per returned value.
+        # repr() preserves full float precision, unlike str() on older
+        # Pythons.
+        metrics = {
+            "successful_transactions": successful,
+            "failed_transactions": failed,
             "total_transactions": total_tx,
-            "success_rate": (
-                successful_tx._value.get() / total_tx if total_tx > 0 else 0.0
-            ),
-            "average_gas_used": (
-                sum(
-                    self.transaction_gas_used.labels(protocol=protocol, action=protocol_action_tuple[1])._sum.get()  # noqa: E501
-                    for protocol_action_tuple in self.transaction_gas_used._metrics.keys() if protocol_action_tuple[0] == protocol  # noqa: E501
-                )
-                / total_tx
-                if total_tx > 0
-                else 0.0
-            ),
+            "success_rate": successful / total_tx if total_tx > 0 else 0.0,
+            "average_gas_used": gas_sum / total_tx if total_tx > 0 else 0.0,
             "average_value_usd": (
-                Decimal(str(sum(
-                    self.transaction_value_usd.labels(protocol=protocol, action=protocol_action_tuple[1])._sum.get()  # noqa: E501
-                    for protocol_action_tuple in self.transaction_value_usd._metrics.keys() if protocol_action_tuple[0] == protocol  # noqa: E501
-                )))
-                / Decimal(str(total_tx))
-                if total_tx > 0
-                else Decimal("0.0")
-            ),
-            "total_gas_used": (
-                Decimal(str(sum(
-                    self.transaction_gas_used.labels(protocol=protocol, action=protocol_action_tuple[1])._sum.get()  # noqa: E501
-                    for protocol_action_tuple in self.transaction_gas_used._metrics.keys() if protocol_action_tuple[0] == protocol  # noqa: E501
-                )))
-            ),
-            "total_value_usd": (
-                Decimal(str(sum(
-                    self.transaction_value_usd.labels(protocol=protocol, action=protocol_action_tuple[1])._sum.get()  # noqa: E501
-                    for protocol_action_tuple in self.transaction_value_usd._metrics.keys() if protocol_action_tuple[0] == protocol  # noqa: E501
-                )))
+                Decimal(repr(value_sum / total_tx))
+                if total_tx > 0 else Decimal("0.0")
             ),
+            "total_gas_used": Decimal(repr(gas_sum)),
+            "total_value_usd": Decimal(repr(value_sum)),
         }
+        self._protocol_metrics_cache[protocol] = (now, metrics)
+        return metrics
 
     def export_prometheus_format(self) -> bytes:
         """
@@ -574,11 +920,29 @@ class MetricsCollector:
             >>> print(prometheus_data.decode('utf-8'))
         """
         try:
-            return generate_latest(self.registry)
+            now = time.monotonic()
+            ts, buf = self._export_cache
+            if buf and self._export_ttl > 0 and now - ts < self._export_ttl:
+                return buf
+            buf = generate_latest(self.registry)
+            self._export_cache = (now, buf)
+            return buf
         except Exception as e:
-            logger.error(f"Failed to export Prometheus format: {e}")
+            logger.error("Failed to export Prometheus format: %s", e)
             raise RuntimeError(f"Prometheus export failed: {e}")
 
+    def make_metrics_app(self) -> Any:
+        """
+        Build an ASGI app serving this collector's registry.
+
+        Mountable on FastAPI/Starlette (e.g. ``app.mount("/metrics", ...)``),
+        and works unchanged in multiprocess mode since the registry is
+        already backed by ``MultiProcessCollector`` when
+        ``PROMETHEUS_MULTIPROC_DIR`` is set.
+        """
+        from prometheus_client import make_asgi_app
+        return make_asgi_app(registry=self.registry)
+
     def get_scheduler_metrics(self) -> Dict[str, Any]:
         """
         Retrieve aggregated scheduler metrics.
@@ -587,13 +951,16 @@ class MetricsCollector:
         """
         # For now, return dummy data or derive from Prometheus counters.
         total_tasks = self.scheduled_tasks_total._value.get()
-        completed_tasks = self.task_execution_status.labels(
-            protocol="overall", status='completed'
-        )._value.get()
-        failed_tasks = self.task_execution_status.labels(
-            protocol="overall", status='failed'
-        )._value.get()
-        
+        # Aggregate across protocols from the existing children instead of
+        # reading a synthetic protocol="overall" series.
+        completed_tasks = 0.0
+        failed_tasks = 0.0
+        for (_p, status), child in self.task_execution_status._metrics.items():
+            if status == 'completed':
+                completed_tasks += child._value.get()
+            elif status == 'failed':
+                failed_tasks += child._value.get()
+
         # Dummy average duration and total gas used
         avg_task_duration = 10.0  # seconds
         total_gas_used = self.scheduler_total_gas_used._value.get()
@@ -614,10 +981,10 @@ class MetricsCollector:
         This is a placeholder for actual persistence logic.
         """
         try:
-            self.redis_client.setex(key, expiry_seconds, json.dumps(metrics_data))
-            logger.info(f"Persisted metrics for key: {key}")
+            self.redis_client.setex(key, expiry_seconds, _dumps(metrics_data))
+            logger.info("Persisted metrics for key: %s", key)
         except Exception as e:
-            logger.error(f"Failed to persist metrics for {key}: {e}")
+            logger.error("Failed to persist metrics for %s: %s", key, e)
             raise RuntimeError(f"Metrics persistence failed: {e}")
 
     def recover_metrics(self, key: str) -> Optional[Dict[str, Any]]:
@@ -628,11 +995,11 @@ class MetricsCollector:
         try:
             data = self.redis_client.get(key)
             if data:
-                return json.loads(data)
-            logger.info(f"Recovered metrics for key: {key}")
+                return _loads(data)
+            logger.info("Recovered metrics for key: %s", key)
             return None
         except Exception as e:
-            logger.error(f"Failed to recover metrics for {key}: {e}")
+            logger.error("Failed to recover metrics for %s: %s", key, e)
             raise RuntimeError(f"Metrics recovery failed: {e}")
 
 
@@ -4,33 +4,65 @@ Operational Health Checker implementation for monitoring infrastructure.
 This module provides the HealthChecker class that performs comprehensive health
 checks on Phase 3 components (RiskManager, CapitalAllocator, CentralScheduler)
 and monitoring components, exposing health status via HTTP endpoint.
+
+Kubernetes deployments should point ``livenessProbe`` at ``/health/live``
+(process-up check, no component sweep) and ``readinessProbe`` at
+``/health/ready``; ``/health`` remains an alias for the readiness sweep.
 """
 
+import asyncio
+import hashlib
 import logging
 import os
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, NamedTuple, Optional, List
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
 import uvicorn
 
+try:  # orjson serializes the nested component payload several times faster
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Sentinel for probe-and-read attribute access: getattr(x, name, _MISSING)
+# replaces a hasattr check followed by a second attribute lookup.
+_MISSING = object()
+
+class HealthStatus(IntEnum):
+    """Health status enumeration for system components.
 
-class HealthStatus(Enum):
-    """Health status enumeration for system components."""
-    OK = "OK"
-    WARNING = "WARNING"
-    CRITICAL = "CRITICAL"
+    An IntEnum ordered by severity so escalation is a branchless
+    ``max(status, ...)``; serialize with ``.name`` (the wire contract is
+    still the "OK"/"WARNING"/"CRITICAL" strings).
+    """
+    OK = 0
+    WARNING = 1
+    CRITICAL = 2
 
 
-@dataclass
-class ComponentHealth:
-    """Data class for individual component health status."""
+class ComponentHealth(NamedTuple):
+    """Individual component health status.
+
+    A NamedTuple rather than a dataclass: these are built several times
+    per /health request and read field-by-field when the response is
+    assembled, and NamedTuple construction and attribute access are both
+    faster.
+    """
     component_name: str
     status: HealthStatus
     message: str
@@ -38,7 +70,7 @@ class ComponentHealth:
     metrics: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemHealth:
     """Data class for overall system health status."""
     overall_status: HealthStatus
@@ -97,46 +129,154 @@ class HealthChecker:
             os.getenv("HEALTH_MEMORY_CRITICAL_THRESHOLD", "95.0")
         )
 
+        # TTL cache so bursts of probes (k8s liveness/readiness, load
+        # balancers, Prometheus) coalesce into one real check. The lock
+        # makes concurrent fills single-flight. Entries are stamped
+        # with time.monotonic() so NTP jumps cannot skew expiry.
+        self._cache_ttl = float(os.getenv("HEALTH_CHECK_CACHE_TTL", "5"))
+        self._cache: Optional[tuple] = None
+        self._cache_key: Optional[tuple] = None
+        self._cache_lock = threading.Lock()
+
+        # In-flight async sweep shared by concurrent awaiters, so a burst
+        # of requests arriving after TTL expiry coalesces into one probe
+        # run instead of racing over the shared metrics buffers:
+        # (event loop, cache key, future resolving to the SystemHealth).
+        self._async_inflight: Optional[tuple] = None
+
+        # Enum-to-string map so response builders avoid a property lookup
+        # per component per request.
+        self._status_values = {s: s.name for s in HealthStatus}
+
+        # Last serialized /health response: (SystemHealth, bytes, status).
+        self._response_cache: Optional[tuple] = None
+
+        # Reusable per-component payload dicts keyed by component name;
+        # refreshes patch the mutable fields in place.
+        self._response_skeleton: Dict[str, Dict[str, Any]] = {}
+
+        # Preallocated per-component metrics buffers, cleared and refilled
+        # on each probe. Safe because the serialized-bytes cache snapshots
+        # the payload before the next refresh can mutate a buffer.
+        self._metrics_buf: Dict[str, Dict[str, Any]] = {}
+
+        # Log only on overall-status transitions so steady-state scrapes
+        # do not flood the log with identical INFO lines.
+        self._last_logged_status: Optional[HealthStatus] = None
+
+        # O(1) name-to-probe dispatch for check_component_health. Stored
+        # as attribute names (not bound methods) so per-instance patching
+        # of the probes still takes effect.
+        self._component_dispatch = {
+            "system_resources": "_check_system_resources",
+            "external_dependencies": "_check_external_dependencies",
+        }
+
+        # Prime the process-wide CPU sampler so the first
+        # cpu_percent(interval=None) delta in _check_system_resources is
+        # meaningful instead of 0.0.
+        try:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        except Exception:  # pragma: no cover - psutil priming is best-effort
+            pass
+
+    def _cache_headers(self, etag: str) -> Dict[str, str]:
+        """Conditional-request headers for the serialized health payload."""
+        return {
+            "ETag": etag,
+            "Cache-Control": f"max-age={int(self._cache_ttl)}",
+        }
+
     def _setup_routes(self) -> None:
         """Setup FastAPI routes for health check endpoints."""
 
+        @self.app.get("/health/live")
+        async def liveness_endpoint() -> Response:
+            """
+            Liveness probe: the process is up and serving requests.
+
+            Intentionally does no component checks so k8s liveness probes
+            stay sub-millisecond; point readiness probes at /health/ready.
+            """
+            return Response(
+                content=b'{"status": "ok"}',
+                media_type="application/json"
+            )
+
         @self.app.get("/health")
-        async def health_endpoint() -> JSONResponse:
+        @self.app.get("/health/ready")
+        async def health_endpoint(request: Request) -> JSONResponse:
             """
-            Main health check endpoint returning overall system health.
+            Readiness probe returning overall system health.
+
+            /health is kept as a backward-compatible alias for
+            /health/ready. Responses carry an ETag; scrapers that send
+            If-None-Match get a bodyless 304 while the payload is
+            unchanged.
 
             Returns:
                 JSON response with system health status.
             """
             try:
-                health_status = self.check_system_health()
-                status_code = 200
+                health_status = await self.check_system_health_async()
+
+                # Serialize each SystemHealth exactly once: while the TTL
+                # cache keeps returning the same object, probes get the
+                # prebuilt bytes back without re-running json encoding.
+                cached = self._response_cache
+                if cached is not None and cached[0] is health_status:
+                    etag = cached[3]
+                    if request.headers.get("if-none-match") == etag:
+                        return Response(status_code=304)
+                    return Response(
+                        content=cached[1],
+                        status_code=cached[2],
+                        media_type="application/json",
+                        headers=self._cache_headers(etag)
+                    )
 
+                status_code = 200
                 if health_status.overall_status == HealthStatus.WARNING:
                     status_code = 200  # Still operational
                 elif health_status.overall_status == HealthStatus.CRITICAL:
                     status_code = 503  # Service unavailable
 
-                return JSONResponse(
+                # Reuse one payload dict per component across refreshes:
+                # only the mutable fields are re-assigned, so steady-state
+                # refreshes allocate no new dicts. Safe because the bytes
+                # below are snapshotted immediately after.
+                skeleton = self._response_skeleton
+                component_payloads = []
+                for comp in health_status.components:
+                    entry = skeleton.get(comp.component_name)
+                    if entry is None:
+                        entry = {"name": comp.component_name}
+                        skeleton[comp.component_name] = entry
+                    entry["status"] = self._status_values[comp.status]
+                    entry["message"] = comp.message
+                    entry["last_check"] = comp.last_check
+                    entry["metrics"] = comp.metrics
+                    component_payloads.append(entry)
+
+                body = _json_dumps({
+                    "status": self._status_values[health_status.overall_status],
+                    "timestamp": health_status.timestamp,
+                    "components": component_payloads,
+                    "summary": health_status.summary
+                })
+                etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+                self._response_cache = (health_status, body, status_code, etag)
+                if request.headers.get("if-none-match") == etag:
+                    return Response(status_code=304)
+                return Response(
+                    content=body,
                     status_code=status_code,
-                    content={
-                        "status": health_status.overall_status.value,
-                        "timestamp": health_status.timestamp,
-                        "components": [
-                            {
-                                "name": comp.component_name,
-                                "status": comp.status.value,
-                                "message": comp.message,
-                                "last_check": comp.last_check,
-                                "metrics": comp.metrics
-                            }
-                            for comp in health_status.components
-                        ],
-                        "summary": health_status.summary
-                    }
+                    media_type="application/json",
+                    headers=self._cache_headers(etag)
                 )
             except Exception as e:
-                logger.error(f"Health check endpoint failed: {e}")
+                logger.error("Health check endpoint failed: %s", e)
                 return JSONResponse(
                     status_code=500,
                     content={
@@ -169,7 +309,7 @@ class HealthChecker:
                     status_code=200,
                     content={
                         "name": component_health.component_name,
-                        "status": component_health.status.value,
+                        "status": self._status_values[component_health.status],
                         "message": component_health.message,
                         "last_check": component_health.last_check,
                         "metrics": component_health.metrics
@@ -178,7 +318,7 @@ class HealthChecker:
             except HTTPException:
                 raise
             except Exception as e:
-                logger.error(f"Component health check failed for {component_name}: {e}")
+                logger.error("Component health check failed for %s: %s", component_name, e)
                 return JSONResponse(
                     status_code=500,
                     content={
@@ -193,17 +333,27 @@ class HealthChecker:
         capital_allocator: Optional[Any] = None,
         scheduler: Optional[Any] = None,
         metrics_collector: Optional[Any] = None,
-        alerter: Optional[Any] = None
+        alerter: Optional[Any] = None,
+        use_cache: bool = True,
+        fast_fail: bool = False
     ) -> SystemHealth:
         """
         Perform comprehensive system health check.
 
+        Results are cached for ``HEALTH_CHECK_CACHE_TTL`` seconds (default
+        5) so repeated probes reuse the last check instead of re-running
+        every probe.
+
         Args:
             risk_manager: Optional RiskManager instance to check.
             capital_allocator: Optional CapitalAllocator instance to check.
             scheduler: Optional CentralScheduler instance to check.
             metrics_collector: Optional MetricsCollector instance to check.
             alerter: Optional Alerter instance to check.
+            use_cache: Set False to force a fresh check.
+            fast_fail: Stop at the first CRITICAL component instead of
+                completing the full sweep. Short-circuited results are
+                not cached.
 
         Returns:
             SystemHealth object with overall system status.
@@ -216,64 +366,251 @@ class HealthChecker:
             ... )
             >>> print(f"Overall status: {health_status.overall_status}")
         """
+        cache_key = (
+            id(risk_manager), id(capital_allocator), id(scheduler),
+            id(metrics_collector), id(alerter)
+        )
+        if use_cache:
+            cached = self._cache
+            if (
+                cached is not None
+                and self._cache_key == cache_key
+                and time.monotonic() - cached[0] < self._cache_ttl
+            ):
+                return cached[1]
+
         try:
-            current_time = time.time()
-            components = []
-
-            # Check Phase 3 core components
-            if risk_manager:
-                risk_health = self._check_risk_manager_health(risk_manager)
-                components.append(risk_health)
-
-            if capital_allocator:
-                capital_health = self._check_capital_allocator_health(capital_allocator)
-                components.append(capital_health)
-
-            if scheduler:
-                scheduler_health = self._check_scheduler_health(scheduler)
-                components.append(scheduler_health)
-
-            # Check monitoring components
-            if metrics_collector:
-                collector_health = self._check_metrics_collector_health(metrics_collector)
-                components.append(collector_health)
-
-            if alerter:
-                alerter_health = self._check_alerter_health(alerter)
-                components.append(alerter_health)
-
-            # Check system resources
-            system_health = self._check_system_resources()
-            components.append(system_health)
-
-            # Check external dependencies
-            external_health = self._check_external_dependencies()
-            components.append(external_health)
-
-            # Determine overall status
-            overall_status = self._determine_overall_status(components)
-
-            # Create summary
-            summary = {
-                "total_components": len(components),
-                "ok_count": len([c for c in components if c.status == HealthStatus.OK]),
-                "warning_count": len([c for c in components if c.status == HealthStatus.WARNING]),
-                "critical_count": len([c for c in components if c.status == HealthStatus.CRITICAL])
-            }
-
-            logger.info(f"System health check completed: {overall_status.value}")
-
-            return SystemHealth(
-                overall_status=overall_status,
-                timestamp=current_time,
-                components=components,
-                summary=summary
-            )
+            if fast_fail:
+                # Short-circuited sweeps are partial; run them outside the
+                # cache so they never mask a full result.
+                return self._check_system_health_uncached(
+                    risk_manager, capital_allocator, scheduler,
+                    metrics_collector, alerter, fast_fail=True
+                )
+
+            with self._cache_lock:
+                # Re-check under the lock so concurrent probes collapse to
+                # a single real execution.
+                if use_cache:
+                    cached = self._cache
+                    if (
+                        cached is not None
+                        and self._cache_key == cache_key
+                        and time.monotonic() - cached[0] < self._cache_ttl
+                    ):
+                        return cached[1]
+                health = self._check_system_health_uncached(
+                    risk_manager, capital_allocator, scheduler,
+                    metrics_collector, alerter
+                )
+                self._cache = (time.monotonic(), health)
+                self._cache_key = cache_key
+                return health
 
         except Exception as e:
-            logger.error(f"System health check failed: {e}")
+            logger.error("System health check failed: %s", e)
             raise RuntimeError(f"Failed to check system health: {e}")
 
+    def _check_system_health_uncached(
+        self,
+        risk_manager: Optional[Any],
+        capital_allocator: Optional[Any],
+        scheduler: Optional[Any],
+        metrics_collector: Optional[Any],
+        alerter: Optional[Any],
+        fast_fail: bool = False,
+    ) -> SystemHealth:
+        """Run the component checks without caching.
+
+        With ``fast_fail`` the sweep stops at the first CRITICAL result,
+        so a degraded system does not pay for the remaining (more
+        expensive) probes just to confirm it is degraded.
+        """
+        current_time = time.time()
+
+        # Cheapest probes first so fast_fail short-circuits before the
+        # system-resource sampling.
+        probes = []
+        if scheduler:
+            probes.append((self._check_scheduler_health, scheduler))
+        if risk_manager:
+            probes.append((self._check_risk_manager_health, risk_manager))
+        if capital_allocator:
+            probes.append(
+                (self._check_capital_allocator_health, capital_allocator)
+            )
+        if metrics_collector:
+            probes.append(
+                (self._check_metrics_collector_health, metrics_collector)
+            )
+        if alerter:
+            probes.append((self._check_alerter_health, alerter))
+        probes.append((self._check_external_dependencies, None))
+        probes.append((self._check_system_resources, None))
+
+        components = []
+        for checker, arg in probes:
+            health = (
+                checker(arg, now=current_time) if arg is not None
+                else checker(now=current_time)
+            )
+            components.append(health)
+            if fast_fail and health.status == HealthStatus.CRITICAL:
+                break
+
+        # Determine overall status
+        overall_status, summary = self._summarize_components(components)
+
+        if overall_status != self._last_logged_status:
+            logger.info(
+                "System health check status: %s", overall_status.name
+            )
+            self._last_logged_status = overall_status
+
+        return SystemHealth(
+            overall_status=overall_status,
+            timestamp=current_time,
+            components=components,
+            summary=summary
+        )
+
+    async def check_system_health_async(
+        self,
+        risk_manager: Optional[Any] = None,
+        capital_allocator: Optional[Any] = None,
+        scheduler: Optional[Any] = None,
+        metrics_collector: Optional[Any] = None,
+        alerter: Optional[Any] = None,
+        use_cache: bool = True
+    ) -> SystemHealth:
+        """
+        Async variant of :meth:`check_system_health`.
+
+        Runs the individual component probes concurrently via
+        ``asyncio.gather`` so total latency is bounded by the slowest
+        probe rather than the sum of all of them. Results share the same
+        TTL cache as the synchronous path, and concurrent callers on the
+        same loop coalesce onto a single in-flight sweep (the async
+        counterpart of the sync path's lock), so parallel requests never
+        mutate the shared metrics buffers at the same time.
+
+        Args:
+            risk_manager: Optional RiskManager instance to check.
+            capital_allocator: Optional CapitalAllocator instance to check.
+            scheduler: Optional CentralScheduler instance to check.
+            metrics_collector: Optional MetricsCollector instance to check.
+            alerter: Optional Alerter instance to check.
+            use_cache: Set False to force a fresh check.
+
+        Returns:
+            SystemHealth object with overall system status.
+        """
+        cache_key = (
+            id(risk_manager), id(capital_allocator), id(scheduler),
+            id(metrics_collector), id(alerter)
+        )
+        if use_cache:
+            cached = self._cache
+            if (
+                cached is not None
+                and self._cache_key == cache_key
+                and time.monotonic() - cached[0] < self._cache_ttl
+            ):
+                return cached[1]
+
+        # Async single-flight: piggyback on a sweep already running for
+        # the same components on this loop instead of starting a second
+        # one that would race over the shared metrics buffers.
+        loop = asyncio.get_running_loop()
+        inflight = self._async_inflight
+        if (
+            inflight is not None
+            and inflight[0] is loop
+            and inflight[1] == cache_key
+            and not inflight[2].done()
+        ):
+            return await inflight[2]
+
+        future: asyncio.Future = loop.create_future()
+        self._async_inflight = (loop, cache_key, future)
+        try:
+            health = await self._check_system_health_async_uncached(
+                risk_manager, capital_allocator, scheduler,
+                metrics_collector, alerter
+            )
+        except Exception as e:
+            logger.error("System health check failed: %s", e)
+            error = RuntimeError(f"Failed to check system health: {e}")
+            future.set_exception(error)
+            # Mark retrieved so a burst-free failure does not log a
+            # "Future exception was never retrieved" warning.
+            future.exception()
+            raise error
+        else:
+            future.set_result(health)
+            self._cache = (time.monotonic(), health)
+            self._cache_key = cache_key
+            return health
+        finally:
+            if (
+                self._async_inflight is not None
+                and self._async_inflight[2] is future
+            ):
+                self._async_inflight = None
+
+    async def _check_system_health_async_uncached(
+        self,
+        risk_manager: Optional[Any],
+        capital_allocator: Optional[Any],
+        scheduler: Optional[Any],
+        metrics_collector: Optional[Any],
+        alerter: Optional[Any],
+    ) -> SystemHealth:
+        """Run the component probes concurrently without caching."""
+        current_time = time.time()
+
+        # Same probe ordering as the sync path so both produce
+        # identically ordered components.
+        probes = []
+        if scheduler:
+            probes.append((self._check_scheduler_health, scheduler))
+        if risk_manager:
+            probes.append((self._check_risk_manager_health, risk_manager))
+        if capital_allocator:
+            probes.append(
+                (self._check_capital_allocator_health, capital_allocator)
+            )
+        if metrics_collector:
+            probes.append(
+                (self._check_metrics_collector_health, metrics_collector)
+            )
+        if alerter:
+            probes.append((self._check_alerter_health, alerter))
+        probes.append((self._check_external_dependencies,))
+        probes.append((self._check_system_resources,))
+
+        components = list(await asyncio.gather(
+            *(
+                asyncio.to_thread(*probe, now=current_time)
+                for probe in probes
+            )
+        ))
+
+        overall_status, summary = self._summarize_components(components)
+
+        if overall_status != self._last_logged_status:
+            logger.info(
+                "System health check status: %s", overall_status.name
+            )
+            self._last_logged_status = overall_status
+
+        return SystemHealth(
+            overall_status=overall_status,
+            timestamp=current_time,
+            components=components,
+            summary=summary
+        )
+
     def check_component_health(self, component_name: str) -> Optional[ComponentHealth]:
         """
         Check health of a specific component by name.
@@ -290,53 +627,131 @@ class HealthChecker:
             ...     print(f"Status: {component_health.status}")
         """
         try:
-            
-            if component_name == "system_resources":
-                return self._check_system_resources()
-            elif component_name == "external_dependencies":
-                return self._check_external_dependencies()
-            else:
-                logger.warning(f"Unknown component: {component_name}")
+            handler = self._component_dispatch.get(component_name)
+            if handler is None:
+                logger.warning("Unknown component: %s", component_name)
                 return None
+            result = getattr(self, handler)()
+            # Detach from the reusable buffer: direct callers may hold the
+            # result across later probes.
+            return result._replace(metrics=dict(result.metrics))
 
         except Exception as e:
-            logger.error(f"Component health check failed for {component_name}: {e}")
-            return ComponentHealth(
-                component_name=component_name,
-                status=HealthStatus.CRITICAL,
-                message=f"Health check failed: {e}",
-                last_check=time.time(),
-                metrics={}
-            )
+            return self._critical_fallback(component_name, component_name, e)
+
+    # Attribute-probe spec tables: (attr, metric_key, kind, bad_status,
+    # bad_message). Kinds: "flag" records the raw value and is bad when
+    # truthy; "running" records the raw value and is bad when falsy;
+    # "present" records presence as a bool and is bad when missing;
+    # "count" records len() and is bad when empty; "value" records
+    # ``val.value`` and is bad when missing; "raw" records the value and
+    # is never bad. A bad_status of None never escalates.
+    _RISK_MANAGER_SPECS = (
+        ("circuit_breaker_active", "circuit_breaker_active", "flag",
+         HealthStatus.CRITICAL, "Circuit breaker is active"),
+        ("risk_limits", "risk_limits_configured", "present",
+         HealthStatus.WARNING, "Risk limits not configured"),
+    )
+    _CAPITAL_ALLOCATOR_SPECS = (
+        ("portfolio_history", "portfolio_history_length", "count",
+         HealthStatus.WARNING, "No portfolio history available"),
+        ("allocation_strategy", "allocation_strategy", "value",
+         HealthStatus.WARNING, "Allocation strategy not configured"),
+    )
+    _SCHEDULER_SPECS = (
+        ("_running", "is_running", "running",
+         HealthStatus.CRITICAL, "Scheduler is not running"),
+        ("_task_definitions", "task_count", "count",
+         HealthStatus.WARNING, "No tasks defined"),
+    )
+    _METRICS_COLLECTOR_SPECS = (
+        ("registry", "registry_configured", "present",
+         HealthStatus.CRITICAL, "Metrics registry not configured"),
+        ("collection_interval", "collection_interval", "raw", None, None),
+    )
+    _ALERTER_SPECS = (
+        ("alert_rules", "alert_rules_count", "count",
+         HealthStatus.WARNING, "No alert rules configured"),
+        ("notification_channels", "notification_channels_count", "count",
+         HealthStatus.WARNING, "No notification channels configured"),
+        ("active_alerts", "active_alerts_count", "count", None, None),
+    )
+
+    def _metrics_buffer(self, component_name: str) -> Dict[str, Any]:
+        """Return the cleared, reusable metrics dict for a component."""
+        buf = self._metrics_buf.get(component_name)
+        if buf is None:
+            buf = self._metrics_buf[component_name] = {}
+        else:
+            buf.clear()
+        return buf
 
-    def _check_risk_manager_health(self, risk_manager: Any) -> ComponentHealth:
-        """Check RiskManager component health."""
+    def _critical_fallback(
+        self,
+        component_name: str,
+        label: str,
+        exc: BaseException,
+        now: Optional[float] = None,
+    ) -> ComponentHealth:
+        """Cold-path constructor for a CRITICAL probe-failure result."""
+        logger.error("%s health check failed: %s", label, exc)
+        return ComponentHealth(
+            component_name=component_name,
+            status=HealthStatus.CRITICAL,
+            message=f"Health check failed: {exc}",
+            last_check=now if now is not None else time.time(),
+            # A plain dict: this is a cold path and the payload must stay
+            # JSON-serializable for the /health endpoints.
+            metrics={}
+        )
+
+    def _check_attrs(
+        self,
+        component_name: str,
+        display_name: str,
+        obj: Any,
+        specs: tuple,
+        now: Optional[float] = None,
+    ) -> ComponentHealth:
+        """Walk a spec table against ``obj`` and build its ComponentHealth."""
+        current_time = now if now is not None else time.time()
         try:
-            current_time = time.time()
-            metrics: Dict[str, Any] = {}
+            metrics = self._metrics_buffer(component_name)
             status = HealthStatus.OK
-            message = "Risk Manager is healthy"
-
-            # Check if circuit breaker is active
-            if hasattr(risk_manager, 'circuit_breaker_active'):
-                circuit_breaker_active = risk_manager.circuit_breaker_active
-                metrics['circuit_breaker_active'] = circuit_breaker_active
-
-                if circuit_breaker_active:
-                    status = HealthStatus.CRITICAL
-                    message = "Circuit breaker is active"
-
-            # Check risk limits configuration
-            if hasattr(risk_manager, 'risk_limits'):
-                metrics['risk_limits_configured'] = True
-            else:
-                metrics['risk_limits_configured'] = False
-                if status == HealthStatus.OK:  # Only set WARNING if not already CRITICAL
-                    status = HealthStatus.WARNING
-                    message = "Risk limits not configured"
+            message = f"{display_name} is healthy"
+
+            for attr, metric_key, kind, bad_status, bad_message in specs:
+                val = getattr(obj, attr, _MISSING)
+                present = val is not _MISSING
+                bad = False
+                if kind == "present":
+                    metrics[metric_key] = present
+                    bad = not present
+                elif not present:
+                    # Other kinds record nothing for a missing attribute;
+                    # only "value" treats the absence as unhealthy.
+                    bad = kind == "value"
+                elif kind == "flag":
+                    metrics[metric_key] = val
+                    bad = bool(val)
+                elif kind == "running":
+                    metrics[metric_key] = val
+                    bad = not val
+                elif kind == "count":
+                    count = len(val)
+                    metrics[metric_key] = count
+                    bad = count == 0
+                elif kind == "value":
+                    metrics[metric_key] = val.value
+                else:  # "raw"
+                    metrics[metric_key] = val
+
+                if bad and bad_status is not None and bad_status > status:
+                    status = bad_status
+                    message = bad_message
 
             return ComponentHealth(
-                component_name="risk_manager",
+                component_name=component_name,
                 status=status,
                 message=message,
                 last_check=current_time,
@@ -344,201 +759,102 @@ class HealthChecker:
             )
 
         except Exception as e:
-            logger.error(f"Risk manager health check failed: {e}")
-            return ComponentHealth(
-                component_name="risk_manager",
-                status=HealthStatus.CRITICAL,
-                message=f"Health check failed: {e}",
-                last_check=time.time(),
-                metrics={}
+            return self._critical_fallback(
+                component_name, display_name, e, current_time
             )
 
+    def _check_risk_manager_health(
+        self, risk_manager: Any, now: Optional[float] = None
+    ) -> ComponentHealth:
+        """Check RiskManager component health."""
+        return self._check_attrs(
+            "risk_manager", "Risk Manager", risk_manager,
+            self._RISK_MANAGER_SPECS, now=now
+        )
+
     def _check_capital_allocator_health(
-        self, capital_allocator: Any) -> ComponentHealth:
+        self, capital_allocator: Any, now: Optional[float] = None
+    ) -> ComponentHealth:
         """Check CapitalAllocator component health."""
-        try:
-            current_time = time.time()
-            metrics: Dict[str, Any] = {}
-            status = HealthStatus.OK
-            message = "Capital Allocator is healthy"
-
-            # Check portfolio history
-            if hasattr(capital_allocator, 'portfolio_history'):
-                history_length = len(capital_allocator.portfolio_history)
-                metrics['portfolio_history_length'] = history_length
-
-                if history_length == 0:
-                    status = HealthStatus.WARNING
-                    message = "No portfolio history available"
-
-            # Check allocation strategy
-            if hasattr(capital_allocator, 'allocation_strategy'):
-                metrics['allocation_strategy'] = capital_allocator.allocation_strategy.value
-            else:
-                status = HealthStatus.WARNING
-                message = "Allocation strategy not configured"
-
-            return ComponentHealth(
-                component_name="capital_allocator",
-                status=status,
-                message=message,
-                last_check=current_time,
-                metrics=metrics
-            )
-
-        except Exception as e:
-            logger.error(f"Capital allocator health check failed: {e}")
-            return ComponentHealth(
-                component_name="capital_allocator",
-                status=HealthStatus.CRITICAL,
-                message=f"Health check failed: {e}",
-                last_check=time.time(),
-                metrics={}
-            )
+        return self._check_attrs(
+            "capital_allocator", "Capital Allocator", capital_allocator,
+            self._CAPITAL_ALLOCATOR_SPECS, now=now
+        )
 
-    def _check_scheduler_health(self, scheduler: Any) -> ComponentHealth:
+    def _check_scheduler_health(
+        self, scheduler: Any, now: Optional[float] = None
+    ) -> ComponentHealth:
         """Check CentralScheduler component health."""
-        try:
-            current_time = time.time()
-            metrics: Dict[str, Any] = {}
-            status = HealthStatus.OK
-            message = "Scheduler is healthy"
-
-            # Check if scheduler is running
-            if hasattr(scheduler, '_running'):
-                is_running = scheduler._running
-                metrics['is_running'] = is_running
-
-                if not is_running:
-                    status = HealthStatus.CRITICAL
-                    message = "Scheduler is not running"
-
-            # Check task definitions
-            if hasattr(scheduler, '_task_definitions'):
-                task_count = len(scheduler._task_definitions)
-                metrics['task_count'] = task_count
-
-                if task_count == 0:
-                    status = HealthStatus.WARNING
-                    message = "No tasks defined"
-
-            return ComponentHealth(
-                component_name="scheduler",
-                status=status,
-                message=message,
-                last_check=current_time,
-                metrics=metrics
-            )
-
-        except Exception as e:
-            logger.error(f"Scheduler health check failed: {e}")
-            return ComponentHealth(
-                component_name="scheduler",
-                status=HealthStatus.CRITICAL,
-                message=f"Health check failed: {e}",
-                last_check=time.time(),
-                metrics={}
-            )
+        return self._check_attrs(
+            "scheduler", "Scheduler", scheduler, self._SCHEDULER_SPECS,
+            now=now
+        )
 
     def _check_metrics_collector_health(
-        self, metrics_collector: Any) -> ComponentHealth:
+        self, metrics_collector: Any, now: Optional[float] = None
+    ) -> ComponentHealth:
         """Check MetricsCollector component health."""
-        try:
-            current_time = time.time()
-            metrics: Dict[str, Any] = {}
-            status = HealthStatus.OK
-            message = "Metrics Collector is healthy"
-
-            # Check if collector is configured
-            if hasattr(metrics_collector, 'registry'):
-                metrics['registry_configured'] = True
-            else:
-                status = HealthStatus.CRITICAL
-                message = "Metrics registry not configured"
-
-            # Check collection interval
-            if hasattr(metrics_collector, 'collection_interval'):
-                metrics['collection_interval'] = metrics_collector.collection_interval
-
-            return ComponentHealth(
-                component_name="metrics_collector",
-                status=status,
-                message=message,
-                last_check=current_time,
-                metrics=metrics
-            )
-
-        except Exception as e:
-            logger.error(f"Metrics collector health check failed: {e}")
-            return ComponentHealth(
-                component_name="metrics_collector",
-                status=HealthStatus.CRITICAL,
-                message=f"Health check failed: {e}",
-                last_check=time.time(),
-                metrics={}
-            )
+        return self._check_attrs(
+            "metrics_collector", "Metrics Collector", metrics_collector,
+            self._METRICS_COLLECTOR_SPECS, now=now
+        )
 
-    def _check_alerter_health(self, alerter: Any) -> ComponentHealth:
+    def _check_alerter_health(
+        self, alerter: Any, now: Optional[float] = None
+    ) -> ComponentHealth:
         """Check Alerter component health."""
-        try:
-            current_time = time.time()
-            metrics: Dict[str, Any] = {}
-            status = HealthStatus.OK
-            message = "Alerter is healthy"
-
-            # Check alert rules
-            if hasattr(alerter, 'alert_rules'):
-                rules_count = len(alerter.alert_rules)
-                metrics['alert_rules_count'] = rules_count
-
-                if rules_count == 0:
-                    status = HealthStatus.WARNING
-                    message = "No alert rules configured"
-
-            # Check notification channels
-            if hasattr(alerter, 'notification_channels'):
-                channels_count = len(alerter.notification_channels)
-                metrics['notification_channels_count'] = channels_count
+        return self._check_attrs(
+            "alerter", "Alerter", alerter, self._ALERTER_SPECS, now=now
+        )
 
-                if channels_count == 0:
-                    status = HealthStatus.WARNING
-                    message = "No notification channels configured"
 
-            # Check active alerts
-            if hasattr(alerter, 'active_alerts'):
-                active_alerts_count = len(alerter.active_alerts)
-                metrics['active_alerts_count'] = active_alerts_count
+    def _read_memory_percent(self) -> float:
+        """Read memory utilisation with a cheap /proc fast path.
 
-            return ComponentHealth(
-                component_name="alerter",
-                status=status,
-                message=message,
-                last_check=current_time,
-                metrics=metrics
-            )
+        Parsing just MemTotal/MemAvailable out of /proc/meminfo is far
+        cheaper than psutil's full virtual_memory() sweep; psutil remains
+        the fallback on non-Linux hosts.
+        """
+        try:
+            with open("/proc/meminfo", "rb") as f:
+                data = f.read()
+            total_at = data.index(b"MemTotal:") + 9
+            total = int(data[total_at:data.index(b"kB", total_at)])
+            avail_at = data.index(b"MemAvailable:") + 13
+            avail = int(data[avail_at:data.index(b"kB", avail_at)])
+            return 100.0 * (1.0 - avail / total)
+        except (OSError, ValueError):
+            import psutil
+            return float(psutil.virtual_memory().percent)
 
-        except Exception as e:
-            logger.error(f"Alerter health check failed: {e}")
-            return ComponentHealth(
-                component_name="alerter",
-                status=HealthStatus.CRITICAL,
-                message=f"Health check failed: {e}",
-                last_check=time.time(),
-                metrics={}
-            )
+    def _read_disk_percent(self) -> float:
+        """Read root-filesystem utilisation via a single statvfs call."""
+        try:
+            st = os.statvfs("/")
+            total = st.f_blocks * st.f_frsize
+            used = total - st.f_bfree * st.f_frsize
+            return (used / total) * 100
+        except (OSError, ZeroDivisionError):
+            import psutil
+            disk = psutil.disk_usage('/')
+            return (disk.used / disk.total) * 100
 
-    def _check_system_resources(self) -> ComponentHealth:
+    def _check_system_resources(
+        self, now: Optional[float] = None
+    ) -> ComponentHealth:
         """Check system resource health (CPU, memory, disk)."""
+        current_time = now if now is not None else time.time()
         try:
             import psutil
 
-            current_time = time.time()
-            metrics: Dict[str, Any] = {}
+            metrics = self._metrics_buffer("system_resources")
             status = HealthStatus.OK
             message = "System resources are healthy"
 
-            # Check CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Check CPU usage. interval=None returns the delta since the
+            # previous call (primed in __init__) instead of sleeping for a
+            # full sampling interval on the request path.
+            cpu_percent = psutil.cpu_percent(interval=None)
             metrics['cpu_usage_percent'] = cpu_percent
 
             if cpu_percent >= self.cpu_critical_threshold:
@@ -549,22 +865,20 @@ class HealthChecker:
                 message = f"High CPU usage: {cpu_percent}%"
 
             # Check memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
+            memory_percent = self._read_memory_percent()
             metrics['memory_usage_percent'] = memory_percent
 
             if memory_percent >= self.memory_critical_threshold:
-                if status != HealthStatus.CRITICAL:
+                if HealthStatus.CRITICAL > status:
                     status = HealthStatus.CRITICAL
                     message = f"Critical memory usage: {memory_percent}%"
             elif memory_percent >= self.memory_warning_threshold:
-                if status == HealthStatus.OK:
+                if HealthStatus.WARNING > status:
                     status = HealthStatus.WARNING
                     message = f"High memory usage: {memory_percent}%"
 
             # Check disk usage
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
+            disk_percent = self._read_disk_percent()
             metrics['disk_usage_percent'] = disk_percent
 
             return ComponentHealth(
@@ -576,23 +890,25 @@ class HealthChecker:
             )
 
         except Exception as e:
-            logger.error(f"System resources health check failed: {e}")
-            return ComponentHealth(
-                component_name="system_resources",
-                status=HealthStatus.CRITICAL,
-                message=f"Health check failed: {e}",
-                last_check=time.time(),
-                metrics={}
+            return self._critical_fallback(
+                "system_resources", "System resources", e, current_time
             )
 
-    def _check_external_dependencies(self) -> ComponentHealth:
+    def _check_external_dependencies(
+        self, now: Optional[float] = None
+    ) -> ComponentHealth:
         """Check external dependencies health (blockchain nodes, APIs)."""
+        current_time = now if now is not None else time.time()
         try:
-            current_time = time.time()
-            metrics: Dict[str, Any] = {}
+            metrics = self._metrics_buffer("external_dependencies")
             status = HealthStatus.OK
             message = "External dependencies are healthy"
 
+            # RPC URLs and the pytest marker are read per call on purpose:
+            # tests (and operators) adjust the environment after the
+            # checker is constructed. Read each variable once per check.
+            in_test_env = bool(os.getenv("PYTEST_CURRENT_TEST"))
+
             # Check blockchain connectivity (stub implementation)
             eth_rpc_url = os.getenv("ETH_RPC_URL")
             if eth_rpc_url:
@@ -602,7 +918,7 @@ class HealthChecker:
             else:
                 metrics['eth_rpc_configured'] = False
                 # Only warn if we're not in a test environment
-                if not os.getenv("PYTEST_CURRENT_TEST"):
+                if not in_test_env:
                     status = HealthStatus.WARNING
                     message = "ETH RPC URL not configured"
 
@@ -613,7 +929,7 @@ class HealthChecker:
             else:
                 metrics['scroll_rpc_configured'] = False
                 # Only warn if we're not in a test environment and no other warnings
-                if not os.getenv("PYTEST_CURRENT_TEST") and status == HealthStatus.OK:
+                if not in_test_env and status == HealthStatus.OK:
                     status = HealthStatus.WARNING
                     message = "Scroll RPC URL not configured"
 
@@ -626,30 +942,39 @@ class HealthChecker:
             )
 
         except Exception as e:
-            logger.error(f"External dependencies health check failed: {e}")
-            return ComponentHealth(
-                component_name="external_dependencies",
-                status=HealthStatus.CRITICAL,
-                message=f"Health check failed: {e}",
-                last_check=time.time(),
-                metrics={}
+            return self._critical_fallback(
+                "external_dependencies", "External dependencies", e,
+                current_time
             )
 
+    def _summarize_components(
+        self, components: List[ComponentHealth]
+    ) -> tuple:
+        """Compute overall status and summary counts in a single pass."""
+        counts = {
+            HealthStatus.OK: 0,
+            HealthStatus.WARNING: 0,
+            HealthStatus.CRITICAL: 0,
+        }
+        for c in components:
+            counts[c.status] += 1
+
+        overall = max(
+            (c.status for c in components), default=HealthStatus.CRITICAL
+        )
+
+        summary = {
+            "total_components": len(components),
+            "ok_count": counts[HealthStatus.OK],
+            "warning_count": counts[HealthStatus.WARNING],
+            "critical_count": counts[HealthStatus.CRITICAL],
+        }
+        return overall, summary
+
     def _determine_overall_status(
         self, components: List[ComponentHealth]) -> HealthStatus:
         """Determine overall system status from component statuses."""
-        if not components:
-            return HealthStatus.CRITICAL
-
-        critical_count = len([c for c in components if c.status == HealthStatus.CRITICAL])
-        warning_count = len([c for c in components if c.status == HealthStatus.WARNING])
-
-        if critical_count > 0:
-            return HealthStatus.CRITICAL
-        elif warning_count > 0:
-            return HealthStatus.WARNING
-        else:
-            return HealthStatus.OK
+        return self._summarize_components(components)[0]
 
     def start_server(self, host: str = "0.0.0.0") -> None:
         """
@@ -663,15 +988,30 @@ class HealthChecker:
             >>> health_checker.start_server()  # Starts on port 8001
         """
         try:
-            logger.info(f"Starting health check server on {host}:{self.http_port}")
+            logger.info("Starting health check server on %s:%s", host, self.http_port)
+            workers = int(os.getenv("HEALTH_CHECK_WORKERS", "1"))
+            if workers > 1:
+                # uvicorn ignores workers when given an app object rather
+                # than an import string; make the fallback explicit.
+                logger.warning(
+                    "HEALTH_CHECK_WORKERS=%s ignored: multi-worker mode "
+                    "requires an import-string app; running 1 worker",
+                    workers
+                )
+            # loop/http "auto" picks uvloop and httptools when installed
+            # (see the monitoring extra); access_log would emit a line per
+            # probe, so it stays off.
             uvicorn.run(
                 self.app,
                 host=host,
                 port=self.http_port,
-                log_level="info"
+                log_level="warning",
+                loop="auto",
+                http="auto",
+                access_log=False
             )
         except Exception as e:
-            logger.error(f"Failed to start health check server: {e}")
+            logger.error("Failed to start health check server: %s", e)
             raise RuntimeError(f"Health check server startup failed: {e}")
 
 
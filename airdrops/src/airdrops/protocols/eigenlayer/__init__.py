@@ -1,15 +1,43 @@
-"""EigenLayer protocol module for LST restaking operations."""
-
-from airdrops.protocols.eigenlayer.eigenlayer import restake_lst
-from airdrops.protocols.eigenlayer.exceptions import (
-    DepositCapReachedError,
-    EigenLayerRestakeError,
-    UnsupportedLSTError,
-)
-
-__all__ = [
-    "restake_lst",
-    "DepositCapReachedError",
-    "EigenLayerRestakeError", 
-    "UnsupportedLSTError",
-]
\ No newline at end of file
+"""EigenLayer protocol module for LST restaking operations.
+
+Re-exports are resolved lazily (PEP 562) so importing the package does
+not drag ``eigenlayer.eigenlayer`` — and with it web3 — into processes
+that never touch EigenLayer.
+"""
+
+_LAZY = {
+    "LSTSymbol": ("airdrops.protocols.eigenlayer.eigenlayer", "LSTSymbol"),
+    "restake_lst": ("airdrops.protocols.eigenlayer.eigenlayer", "restake_lst"),
+    "restake_lst_async": (
+        "airdrops.protocols.eigenlayer.eigenlayer", "restake_lst_async"
+    ),
+    "restake_lst_batch": (
+        "airdrops.protocols.eigenlayer.eigenlayer", "restake_lst_batch"
+    ),
+    "DepositCapReachedError": (
+        "airdrops.protocols.eigenlayer.exceptions", "DepositCapReachedError"
+    ),
+    "EigenLayerRestakeError": (
+        "airdrops.protocols.eigenlayer.exceptions", "EigenLayerRestakeError"
+    ),
+    "UnsupportedLSTError": (
+        "airdrops.protocols.eigenlayer.exceptions", "UnsupportedLSTError"
+    ),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY])
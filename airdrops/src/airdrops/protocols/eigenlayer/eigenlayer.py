@@ -1,15 +1,26 @@
-"""EigenLayer protocol module for restaking LSTs."""
+"""EigenLayer protocol module for restaking LSTs.
 
+Callers supply the Web3 instance; for remote RPC endpoints build it with
+a pooled Keep-Alive provider (see :func:`_build_provider`) so the several
+RPCs issued per restake reuse one TCP/TLS connection instead of paying a
+handshake each.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from importlib import resources
 import json
-import os
-from typing import Dict, Optional, Tuple, List, Any # Ensure Any is imported
+import time
+import weakref
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Optional, Tuple, List, Any, Union # Ensure Any is imported
+from eth_abi import decode as _abi_decode, encode as _abi_encode
 from web3 import Web3
 # from web3.exceptions import TransactionNotFound # Unused import
 
-from airdrops.protocols.eigenlayer.eigenlayer_config import (
-    EIGENLAYER_CONTRACTS,
-    LST_TOKENS,
-)
+from airdrops.protocols.eigenlayer.eigenlayer_config import LST_ASSET_DETAILS
 from .exceptions import (
     DepositCapReachedError,
     EigenLayerRestakeError,
@@ -19,30 +30,116 @@ import logging # Changed from airdrops.shared.config
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
 
-# Strategy mapping
-LST_STRATEGIES = {
-    "stETH": EIGENLAYER_CONTRACTS["steth_strategy"],
-    "rETH": EIGENLAYER_CONTRACTS["reth_strategy"],
-}
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _json_loads = json.loads
 
 
-def _load_abi(filename: str) -> List[Dict[str, Any]]:
-    """Load ABI from JSON file.
-    
+# Resolved once at import; saves the per-call dirname/join and keeps the
+# lookup working when the package is installed rather than run in place.
+_ABI_DIR = resources.files(__package__) / "abi"
+
+
+class LSTSymbol(str, Enum):
+    """Supported LST symbols; values match the LST_ASSET_DETAILS keys."""
+
+    STETH = "stETH"
+    RETH = "rETH"
+
+
+# Multicall3 is deployed at the same address on Ethereum mainnet and most
+# other chains; used to batch the pre-flight reads into one eth_call.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+_SEL_AGGREGATE3 = Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+_SEL_BALANCE_OF = Web3.keccak(text="balanceOf(address)")[:4]
+_SEL_TOTAL_SHARES = Web3.keccak(text="totalShares()")[:4]
+_SEL_MAX_TOTAL_DEPOSITS = Web3.keccak(text="maxTotalDeposits()")[:4]
+_SEL_ALLOWANCE = Web3.keccak(text="allowance(address,address)")[:4]
+
+
+@dataclass(frozen=True)
+class _PreflightReads:
+    """Read-only chain state fetched before sending restake transactions."""
+
+    balance: int
+    total_shares: int
+    max_total_deposits: int
+    allowance: int
+
+
+def _multicall_preflight(
+    web3_eth: Web3,
+    token_address: str,
+    strategy_address: str,
+    user_address: str,
+) -> _PreflightReads:
+    """Fetch all restake pre-flight reads in a single Multicall3 eth_call.
+
+    Batches ``balanceOf``, ``totalShares``, ``maxTotalDeposits`` and
+    ``allowance`` into one ``aggregate3`` round-trip instead of four
+    sequential RPC calls.
+
+    Args:
+        web3_eth: Web3 instance
+        token_address: LST token contract address
+        strategy_address: Strategy contract address
+        user_address: Address of the restaking wallet
+
+    Returns:
+        Decoded pre-flight values
+
+    Raises:
+        Exception: If Multicall3 is unavailable on the connected chain or
+            the response cannot be decoded; callers fall back to the
+            per-call read path.
+    """
+    calls = [
+        (token_address, _SEL_BALANCE_OF + _abi_encode(["address"], [user_address])),
+        (strategy_address, _SEL_TOTAL_SHARES),
+        (strategy_address, _SEL_MAX_TOTAL_DEPOSITS),
+        (
+            token_address,
+            _SEL_ALLOWANCE
+            + _abi_encode(["address", "address"], [user_address, strategy_address]),
+        ),
+    ]
+    payload = _SEL_AGGREGATE3 + _abi_encode(
+        ["(address,bool,bytes)[]"],
+        [[(target, False, data) for target, data in calls]],
+    )
+    raw = web3_eth.eth.call({"to": MULTICALL3_ADDRESS, "data": payload})
+    results = _abi_decode(["(bool,bytes)[]"], bytes(raw))[0]
+    values = []
+    for success, return_data in results:
+        if not success:
+            raise EigenLayerRestakeError("Multicall3 pre-flight call reverted")
+        values.append(_abi_decode(["uint256"], return_data)[0])
+    return _PreflightReads(*values)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_abi_cached(filename: str) -> List[Dict[str, Any]]:
+    """Read and parse an ABI file, caching the result per filename.
+
+    ABIs are static for the process lifetime, so each file is read and
+    json-parsed at most once. Callers must not mutate the returned list.
+
     Args:
         filename: Name of the ABI file to load
-        
+
     Returns:
         List of ABI definitions
-        
+
     Raises:
         EigenLayerRestakeError: If ABI file cannot be loaded
     """
     try:
-        abi_path = os.path.join(os.path.dirname(__file__), "abi", filename)
-        with open(abi_path, "r") as f:
-            data: List[Dict[str, Any]] = json.load(f)
+        with open(_ABI_DIR / filename, "rb") as f:
+            data: List[Dict[str, Any]] = _json_loads(f.read())
             return data
     except FileNotFoundError:
         raise EigenLayerRestakeError(f"ABI file not found: {filename}")
@@ -50,6 +147,211 @@ def _load_abi(filename: str) -> List[Dict[str, Any]]:
         raise EigenLayerRestakeError(f"Invalid JSON in ABI file: {filename}")
 
 
+def _load_abi(filename: str) -> List[Dict[str, Any]]:
+    """Load ABI from JSON file (cached after the first read).
+
+    Args:
+        filename: Name of the ABI file to load
+
+    Returns:
+        List of ABI definitions
+
+    Raises:
+        EigenLayerRestakeError: If ABI file cannot be loaded
+    """
+    return _load_abi_cached(filename)
+
+
+# Pre-warm the ABI cache so the first restake does not pay the disk and
+# parse cost; failures surface later through _load_abi if truly missing.
+for _abi_file in (
+    "ERC20.json",
+    "StrategyBaseTVLLimits_stETH.json",
+    "StrategyBaseTVLLimits_rETH.json",
+):
+    try:
+        _load_abi_cached(_abi_file)
+    except EigenLayerRestakeError:  # pragma: no cover - missing ABI on disk
+        pass
+del _abi_file
+
+
+# Contract wrappers are expensive to build (ABI reflection into function
+# proxies), so reuse them per Web3 instance instead of rebuilding each call.
+_CONTRACT_CACHE: "weakref.WeakKeyDictionary[Web3, Dict[Tuple[str, str], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_contract(web3_eth: Web3, address: str, abi_file: str) -> Any:
+    """Return a contract instance for (address, abi_file), cached per Web3.
+
+    Args:
+        web3_eth: Web3 instance
+        address: Contract address, already checksummed (config constants are
+            checksummed at import time)
+        abi_file: Name of the ABI file backing the contract
+
+    Returns:
+        Contract instance, reused across calls on the same Web3 instance
+    """
+    try:
+        per_instance = _CONTRACT_CACHE[web3_eth]
+    except KeyError:
+        per_instance = _CONTRACT_CACHE[web3_eth] = {}
+    key = (address, abi_file)
+    contract = per_instance.get(key)
+    if contract is None:
+        contract = per_instance[key] = web3_eth.eth.contract(
+            address=address, abi=_load_abi(abi_file)
+        )
+    return contract
+
+
+def _build_provider(url: str) -> Any:
+    """Build an HTTPProvider backed by a pooled Keep-Alive session.
+
+    Mounting an ``HTTPAdapter`` with a persistent ``requests.Session``
+    lets every RPC in a restake share one TCP/TLS connection rather than
+    opening a fresh one per call.
+
+    Args:
+        url: RPC endpoint URL
+
+    Returns:
+        HTTPProvider suitable for ``Web3(_build_provider(url))``
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from web3.providers.rpc import HTTPProvider
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return HTTPProvider(url, session=session)
+
+
+# LocalAccount objects are cached per key: decoding the secp256k1 scalar is
+# pure CPU and the key material never changes within a process.
+_ACCOUNT_CACHE: Dict[str, Any] = {}
+
+# chain_id is immutable for a connected node; fetch it once per Web3.
+_CHAIN_ID_CACHE: "weakref.WeakKeyDictionary[Web3, int]" = weakref.WeakKeyDictionary()
+
+
+def _get_account(web3_eth: Web3, private_key: str) -> Any:
+    """Return the LocalAccount for a private key, cached across restakes.
+
+    Args:
+        web3_eth: Web3 instance
+        private_key: Private key of the user's wallet
+
+    Returns:
+        LocalAccount derived from the key
+    """
+    account = _ACCOUNT_CACHE.get(private_key)
+    if account is None:
+        account = _ACCOUNT_CACHE[private_key] = web3_eth.eth.account.from_key(private_key)
+    return account
+
+
+def _get_chain_id(web3_eth: Web3) -> int:
+    """Return the chain id for a Web3 instance, fetched at most once.
+
+    Args:
+        web3_eth: Web3 instance
+
+    Returns:
+        Chain id of the connected node
+    """
+    chain_id = _CHAIN_ID_CACHE.get(web3_eth)
+    if chain_id is None:
+        chain_id = web3_eth.eth.chain_id
+        _CHAIN_ID_CACHE[web3_eth] = chain_id
+    return chain_id
+
+
+# Deposit calldata is deterministic for a given (strategy, token, amount),
+# so scheduled same-amount restakes reuse the encoded bytes.
+_DEPOSIT_CALLDATA_CACHE: Dict[Tuple[Any, str, int], Any] = {}
+
+
+def _encode_deposit_calldata(
+    strategy_contract: Any,
+    token_address: str,
+    amount: int
+) -> Any:
+    """Return ABI-encoded calldata for ``deposit(token, amount)``, cached.
+
+    Args:
+        strategy_contract: Strategy contract instance
+        token_address: LST token contract address
+        amount: Amount to deposit in wei
+
+    Returns:
+        Hex-encoded calldata reused across same-amount restakes
+    """
+    key = (strategy_contract.address, token_address, amount)
+    data = _DEPOSIT_CALLDATA_CACHE.get(key)
+    if data is None:
+        # web3 v6 spells this encodeABI, v7 encode_abi.
+        encode = getattr(strategy_contract, "encode_abi", None) or strategy_contract.encodeABI
+        data = _DEPOSIT_CALLDATA_CACHE[key] = encode("deposit", args=[token_address, amount])
+    return data
+
+
+# Last fee-history snapshot per chain; ~one mainnet block of reuse.
+_FEE_TTL_SECONDS = 6.0
+_fee_cache: Dict[Any, Tuple[float, Dict[str, int]]] = {}
+
+
+def _get_gas_params(web3_eth: Web3) -> Dict[str, int]:
+    """Return EIP-1559 fee fields for ``build_transaction``, cached briefly.
+
+    One ``eth_feeHistory`` snapshot (base fee of the latest block plus the
+    median priority tip) is shared by the approve and deposit transactions
+    and reused across restakes within the TTL. Chains or providers without
+    fee-history support fall back to a legacy ``gasPrice`` fetch.
+
+    Args:
+        web3_eth: Web3 instance
+
+    Returns:
+        Dict of fee fields to merge into a transaction
+    """
+    try:
+        chain_id = _get_chain_id(web3_eth)
+        now = time.monotonic()
+        cached = _fee_cache.get(chain_id)
+        if cached is not None and (now - cached[0]) < _FEE_TTL_SECONDS:
+            return cached[1]
+        history = web3_eth.eth.fee_history(4, "latest", [50])
+        base_fee = int(history["baseFeePerGas"][-1])
+        tip = int(history["reward"][-1][0])
+        params = {
+            "maxFeePerGas": base_fee * 2 + tip,
+            "maxPriorityFeePerGas": tip,
+        }
+        _fee_cache[chain_id] = (now, params)
+        return params
+    except Exception:
+        return {"gasPrice": web3_eth.eth.gas_price}
+
+
+def _fetch_fee_and_nonce(web3_eth: Web3, user_address: str) -> Tuple[Dict[str, int], int]:
+    """Fetch fee parameters (cached) and the account nonce.
+
+    Args:
+        web3_eth: Web3 instance
+        user_address: Address whose transaction count is fetched
+
+    Returns:
+        Tuple of (fee parameter dict, nonce)
+    """
+    return _get_gas_params(web3_eth), web3_eth.eth.get_transaction_count(user_address)
+
+
 def _get_eigenlayer_lst_strategy_details(lst_symbol: str) -> Dict[str, str]:
     """Get LST token and strategy contract details.
 
@@ -62,41 +364,23 @@ def _get_eigenlayer_lst_strategy_details(lst_symbol: str) -> Dict[str, str]:
     Raises:
         UnsupportedLSTError: If LST symbol is not supported
     """
-    if lst_symbol not in LST_TOKENS:
+    # LST_ASSET_DETAILS is the single source of truth for per-LST
+    # addresses and ABI files.
+    try:
+        return LST_ASSET_DETAILS[lst_symbol]
+    except KeyError:
         raise UnsupportedLSTError(f"Unsupported LST: {lst_symbol}")
-    
-    token_address = LST_TOKENS[lst_symbol]
-    strategy_address = LST_STRATEGIES[lst_symbol]
-
-    # Determine ABI file names based on LST symbol
-    token_abi_file = "ERC20.json"
-    if lst_symbol == "stETH":
-        strategy_abi_file = "StrategyBaseTVLLimits_stETH.json"
-    elif lst_symbol == "rETH":
-        strategy_abi_file = "StrategyBaseTVLLimits_rETH.json"
-    else:
-        # This case should ideally not be reached due to the check above,
-        # but as a fallback:
-        raise UnsupportedLSTError(f"Unknown LST symbol for ABI determination: {lst_symbol}")
-
-    return {
-        "token_address": token_address,
-        "strategy_address": strategy_address,
-        "token_abi_file": token_abi_file,
-        "strategy_abi_file": strategy_abi_file,
-    }
 
 
 def _check_eigenlayer_deposit_cap(
-    web3_eth: Web3,
-    strategy_address: str,
+    strategy_contract: Any,
     deposit_amount: int
 ) -> bool:
     """Check if deposit would exceed strategy cap.
 
     Args:
-        web3_eth: Web3 instance
-        strategy_address: Strategy contract address
+        strategy_contract: Strategy contract instance, already built with
+            the LST's own TVL-limits ABI by the caller
         deposit_amount: Amount to deposit in wei
 
     Returns:
@@ -106,37 +390,41 @@ def _check_eigenlayer_deposit_cap(
         EigenLayerRestakeError: If contract call fails
     """
     try:
-        # Assuming stETH ABI for cap check as it's a common base.
-        # This might need adjustment if rETH strategy has different cap functions.
-        strategy_abi = _load_abi("StrategyBaseTVLLimits_stETH.json")
-        
-        strategy_contract = web3_eth.eth.contract(
-            address=Web3.to_checksum_address(strategy_address),
-            abi=strategy_abi
-        )
-        
         total_shares = strategy_contract.functions.totalShares().call()
         max_total_deposits = strategy_contract.functions.maxTotalDeposits().call()
-        
+
         return bool((total_shares + deposit_amount) <= max_total_deposits)
-        
+
     except Exception as e:
         raise EigenLayerRestakeError(f"Failed to check deposit cap: {str(e)}")
 
 
+# Unlimited ERC-20 allowance; approving this once removes the approve
+# transaction from every later restake for the same (user, token, strategy).
+MAX_UINT256 = 2**256 - 1
+
+
 def restake_lst(
     web3_eth: Web3,
     private_key: str,
-    lst_symbol: str,
-    amount: int
-) -> Tuple[bool, Optional[str]]:
+    lst_symbol: Union[str, LSTSymbol],
+    amount: int,
+    infinite_approve: bool = True,
+    raw_hash: bool = False
+) -> Tuple[bool, Optional[Any]]:
     """Restake LST tokens into EigenLayer strategy.
 
     Args:
         web3_eth: Web3 instance connected to Ethereum mainnet
         private_key: Private key of the user's wallet
-        lst_symbol: Symbol of the LST to restake ("stETH" or "rETH")
+        lst_symbol: LST to restake; an :class:`LSTSymbol` member or its
+            string value ("stETH" or "rETH")
         amount: Amount to restake in wei
+        infinite_approve: Approve the maximum uint256 instead of ``amount``
+            so subsequent restakes skip the approve transaction entirely
+        raw_hash: Return the deposit hash as ``HexBytes`` instead of a hex
+            string, skipping the per-call string allocation; useful for
+            callers that store or compare hashes as bytes
 
     Returns:
         Tuple of (success, transaction_hash_or_error_message)
@@ -148,60 +436,105 @@ def restake_lst(
     try:
         if amount <= 0:
             raise EigenLayerRestakeError("Amount must be positive")
-        
+
+        try:
+            lst_symbol = LSTSymbol(lst_symbol).value
+        except ValueError:
+            raise UnsupportedLSTError(f"Unsupported LST: {lst_symbol}")
+
         details = _get_eigenlayer_lst_strategy_details(lst_symbol)
         token_address = details["token_address"]
         strategy_address = details["strategy_address"]
         token_abi_file = details["token_abi_file"]
         strategy_abi_file = details["strategy_abi_file"]
         
-        account = web3_eth.eth.account.from_key(private_key)
+        account = _get_account(web3_eth, private_key)
         user_address = account.address
         
-        erc20_abi = _load_abi(token_abi_file)
-        strategy_abi = _load_abi(strategy_abi_file)
-        
-        token_contract = web3_eth.eth.contract(address=Web3.to_checksum_address(token_address), abi=erc20_abi)
-        strategy_contract = web3_eth.eth.contract(address=Web3.to_checksum_address(strategy_address), abi=strategy_abi)
+        token_contract = _get_contract(web3_eth, token_address, token_abi_file)
+        strategy_contract = _get_contract(web3_eth, strategy_address, strategy_abi_file)
         
-        user_balance = token_contract.functions.balanceOf(user_address).call()
+        try:
+            reads: Optional[_PreflightReads] = _multicall_preflight(
+                web3_eth, token_address, strategy_address, user_address
+            )
+        except Exception:
+            logger.debug(
+                "Multicall3 pre-flight unavailable; falling back to per-call reads"
+            )
+            reads = None
+
+        if reads is not None:
+            user_balance = reads.balance
+        else:
+            user_balance = token_contract.functions.balanceOf(user_address).call()
         if user_balance < amount:
             return False, f"Insufficient balance. Have: {user_balance}, Need: {amount}"
-        
-        if not _check_eigenlayer_deposit_cap(web3_eth, strategy_address, amount):
+
+        if reads is not None:
+            if (reads.total_shares + amount) > reads.max_total_deposits:
+                raise DepositCapReachedError("Deposit would exceed strategy cap")
+        elif not _check_eigenlayer_deposit_cap(strategy_contract, amount):
             raise DepositCapReachedError("Deposit would exceed strategy cap")
-        
-        allowance = token_contract.functions.allowance(user_address, strategy_address).call()
+
+        if reads is not None:
+            allowance = reads.allowance
+        else:
+            allowance = token_contract.functions.allowance(user_address, strategy_address).call()
+
+        # One fee snapshot covers both transactions; the deposit nonce is
+        # derived locally instead of re-querying after the approve.
+        fee_params, nonce = _fetch_fee_and_nonce(web3_eth, user_address)
+        # Explicit chainId saves web3.py an eth_chainId lookup per signing.
+        chain_id = _get_chain_id(web3_eth)
+
+        # Approve and deposit are submitted back-to-back with sequential
+        # nonces so they can land in the same block; only the deposit
+        # receipt is awaited — its success implies the approve landed too.
+        approve_hash = None
         if allowance < amount:
-            approve_txn = token_contract.functions.approve(strategy_address, amount).build_transaction({
+            approve_amount = MAX_UINT256 if infinite_approve else amount
+            approve_txn = token_contract.functions.approve(strategy_address, approve_amount).build_transaction({
                 'from': user_address,
                 'gas': 100000,
-                'gasPrice': web3_eth.eth.gas_price,
-                'nonce': web3_eth.eth.get_transaction_count(user_address),
+                'nonce': nonce,
+                'chainId': chain_id,
+                **fee_params,
             })
-            
+
             signed_approve = web3_eth.eth.account.sign_transaction(approve_txn, private_key)
             approve_hash = web3_eth.eth.send_raw_transaction(signed_approve.rawTransaction)
-            approve_receipt = web3_eth.eth.wait_for_transaction_receipt(approve_hash)
-            if approve_receipt['status'] != 1:
-                 return False, "Approval transaction failed"
+            nonce += 1
 
-        deposit_txn = strategy_contract.functions.deposit(token_address, amount).build_transaction({
+        # The deposit tx is assembled from cached calldata instead of going
+        # through the build_transaction machinery; only nonce and fees vary
+        # between same-amount restakes.
+        deposit_txn = {
             'from': user_address,
+            'to': strategy_address,
+            'value': 0,
             'gas': 200000,
-            'gasPrice': web3_eth.eth.gas_price,
-            'nonce': web3_eth.eth.get_transaction_count(user_address),
-        })
-        
+            'nonce': nonce,
+            'chainId': chain_id,
+            'data': _encode_deposit_calldata(strategy_contract, token_address, amount),
+            **fee_params,
+        }
+
         signed_deposit = web3_eth.eth.account.sign_transaction(deposit_txn, private_key)
         deposit_hash = web3_eth.eth.send_raw_transaction(signed_deposit.rawTransaction)
-        
+
         receipt = web3_eth.eth.wait_for_transaction_receipt(deposit_hash)
-        
+
         if receipt['status'] == 1:
-            return True, deposit_hash.hex()
-        else:
-            return False, "Transaction failed"
+            return True, deposit_hash if raw_hash else deposit_hash.hex()
+
+        # Deposit failed: if an approve was submitted, distinguish an
+        # approval failure from a plain deposit revert.
+        if approve_hash is not None:
+            approve_receipt = web3_eth.eth.wait_for_transaction_receipt(approve_hash)
+            if approve_receipt['status'] != 1:
+                return False, "Approval transaction failed"
+        return False, "Transaction failed"
             
     except UnsupportedLSTError:
         raise
@@ -212,8 +545,162 @@ def restake_lst(
         raise EigenLayerRestakeError(f"Restaking operation failed: {str(e)}")
 
 
+def restake_lst_batch(
+    web3_eth: Web3,
+    jobs: List[Tuple[str, str, int]],
+    infinite_approve: bool = True
+) -> List[Tuple[bool, Optional[str]]]:
+    """Run several restakes concurrently in a thread pool.
+
+    Each job is a ``(private_key, lst_symbol, amount)`` tuple. A restake
+    spends nearly all its time blocked on RPC I/O, so threads give close
+    to linear speedup up to the provider's concurrency limit. Jobs must
+    use distinct sender keys — two jobs signing with the same key would
+    race on the account nonce.
+
+    Args:
+        web3_eth: Web3 instance shared by all jobs
+        jobs: List of (private_key, lst_symbol, amount) tuples
+        infinite_approve: Forwarded to :func:`restake_lst` for each job
+
+    Returns:
+        List of (success, transaction_hash_or_error_message) tuples in
+        job order; a job that raises is reported as (False, message)
+        instead of aborting the batch.
+    """
+    if not jobs:
+        return []
+
+    def _run(job: Tuple[str, str, int]) -> Tuple[bool, Optional[str]]:
+        private_key, lst_symbol, amount = job
+        try:
+            return restake_lst(
+                web3_eth, private_key, lst_symbol, amount,
+                infinite_approve=infinite_approve,
+            )
+        except Exception as e:
+            return False, str(e)
+
+    with ThreadPoolExecutor(max_workers=min(len(jobs), 16)) as executor:
+        return list(executor.map(_run, jobs))
+
+
+async def restake_lst_async(
+    async_web3: Any,
+    private_key: str,
+    lst_symbol: str,
+    amount: int,
+    infinite_approve: bool = True
+) -> Tuple[bool, Optional[str]]:
+    """Restake LST tokens into EigenLayer using an ``AsyncWeb3`` instance.
+
+    Mirrors :func:`restake_lst` but issues the independent pre-flight reads
+    (balance, strategy shares, deposit cap, allowance, gas price, nonce)
+    concurrently via ``asyncio.gather``, so their latencies overlap instead
+    of accumulating. Approve and deposit are submitted back-to-back with
+    sequential nonces, as in the sync path.
+
+    Args:
+        async_web3: AsyncWeb3 instance connected to Ethereum mainnet
+        private_key: Private key of the user's wallet
+        lst_symbol: Symbol of the LST to restake ("stETH" or "rETH")
+        amount: Amount to restake in wei
+        infinite_approve: Approve the maximum uint256 instead of ``amount``
+            so subsequent restakes skip the approve transaction entirely
+
+    Returns:
+        Tuple of (success, transaction_hash_or_error_message)
+
+    Raises:
+        UnsupportedLSTError: If LST symbol is not supported
+        DepositCapReachedError: If the deposit would exceed the strategy cap
+        EigenLayerRestakeError: If restaking operation fails
+    """
+    try:
+        if amount <= 0:
+            raise EigenLayerRestakeError("Amount must be positive")
+
+        details = _get_eigenlayer_lst_strategy_details(lst_symbol)
+        token_address = details["token_address"]
+        strategy_address = details["strategy_address"]
+
+        account = async_web3.eth.account.from_key(private_key)
+        user_address = account.address
+
+        token_contract = _get_contract(async_web3, token_address, details["token_abi_file"])
+        strategy_contract = _get_contract(async_web3, strategy_address, details["strategy_abi_file"])
+
+        (
+            user_balance,
+            total_shares,
+            max_total_deposits,
+            allowance,
+            gas_price,
+            nonce,
+        ) = await asyncio.gather(
+            token_contract.functions.balanceOf(user_address).call(),
+            strategy_contract.functions.totalShares().call(),
+            strategy_contract.functions.maxTotalDeposits().call(),
+            token_contract.functions.allowance(user_address, strategy_address).call(),
+            async_web3.eth.gas_price,
+            async_web3.eth.get_transaction_count(user_address),
+        )
+
+        if user_balance < amount:
+            return False, f"Insufficient balance. Have: {user_balance}, Need: {amount}"
+
+        if (total_shares + amount) > max_total_deposits:
+            raise DepositCapReachedError("Deposit would exceed strategy cap")
+
+        approve_hash = None
+        if allowance < amount:
+            approve_amount = MAX_UINT256 if infinite_approve else amount
+            approve_txn = await token_contract.functions.approve(strategy_address, approve_amount).build_transaction({
+                'from': user_address,
+                'gas': 100000,
+                'gasPrice': gas_price,
+                'nonce': nonce,
+            })
+
+            signed_approve = async_web3.eth.account.sign_transaction(approve_txn, private_key)
+            approve_hash = await async_web3.eth.send_raw_transaction(signed_approve.raw_transaction)
+            nonce += 1
+
+        deposit_txn = await strategy_contract.functions.deposit(token_address, amount).build_transaction({
+            'from': user_address,
+            'gas': 200000,
+            'gasPrice': gas_price,
+            'nonce': nonce,
+        })
+
+        signed_deposit = async_web3.eth.account.sign_transaction(deposit_txn, private_key)
+        deposit_hash = await async_web3.eth.send_raw_transaction(signed_deposit.raw_transaction)
+
+        receipt = await async_web3.eth.wait_for_transaction_receipt(deposit_hash)
+
+        if receipt['status'] == 1:
+            return True, deposit_hash.hex()
+
+        if approve_hash is not None:
+            approve_receipt = await async_web3.eth.wait_for_transaction_receipt(approve_hash)
+            if approve_receipt['status'] != 1:
+                return False, "Approval transaction failed"
+        return False, "Transaction failed"
+
+    except UnsupportedLSTError:
+        raise
+    except DepositCapReachedError:
+        raise
+    except Exception as e:
+        logger.error(f"Restaking failed: {str(e)}")
+        raise EigenLayerRestakeError(f"Restaking operation failed: {str(e)}")
+
+
 __all__ = [
+    "LSTSymbol",
     "restake_lst",
+    "restake_lst_async",
+    "restake_lst_batch",
     "UnsupportedLSTError",
     "EigenLayerRestakeError",
     "DepositCapReachedError",
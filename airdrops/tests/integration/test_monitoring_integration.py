@@ -347,7 +347,7 @@ channels:
             None
         )
         assert external_deps_health is not None
-        assert external_deps_health.status.value == "OK"
+        assert external_deps_health.status.name == "OK"
         assert external_deps_health.metrics.get("eth_rpc_status") == "connected"
         assert external_deps_health.metrics.get("scroll_rpc_status") == "connected"
 
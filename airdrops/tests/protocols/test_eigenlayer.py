@@ -1,9 +1,11 @@
 """Unit tests for EigenLayer protocol module."""
 
+import asyncio
 import json
 import pytest
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 from typing import Any
+from eth_account.datastructures import SignedTransaction
 from web3 import Web3
 
 from airdrops.protocols.eigenlayer.eigenlayer import (
@@ -11,6 +13,7 @@ from airdrops.protocols.eigenlayer.eigenlayer import (
     _get_eigenlayer_lst_strategy_details,
     _load_abi,
     restake_lst,
+    restake_lst_async,
 )
 from airdrops.protocols.eigenlayer.exceptions import (
     DepositCapReachedError,
@@ -61,7 +64,7 @@ class TestEigenLayerModule:
         details = _get_eigenlayer_lst_strategy_details("stETH")
 
         assert details["token_address"] == "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84"
-        assert details["strategy_address"] == "0x93c4b944D05dfe6df72a2751b1A0541D03217475"
+        assert details["strategy_address"] == "0x93C4B944d05dfE6DF72A2751b1A0541d03217475"
         assert details["token_abi_file"] == "ERC20.json"
         assert details["strategy_abi_file"] == "StrategyBaseTVLLimits_stETH.json"
 
@@ -70,7 +73,7 @@ class TestEigenLayerModule:
         details = _get_eigenlayer_lst_strategy_details("rETH")
 
         assert details["token_address"] == "0xae78736Cd615f374D3085123A210448E74Fc6393"
-        assert details["strategy_address"] == "0x1BeE69b7dFFfA4E2d53C2A2Df135C34A2B5202c3"
+        assert details["strategy_address"] == "0x1BEe69b7DFffa4E2D53C2a2dF135c34a2B5202c3"
         assert details["token_abi_file"] == "ERC20.json"
         assert details["strategy_abi_file"] == "StrategyBaseTVLLimits_rETH.json"
 
@@ -86,11 +89,8 @@ class TestEigenLayerModule:
         mock_contract.functions.maxTotalDeposits.return_value.call.return_value = 2000
         mock_contract.functions.underlyingToSharesView.return_value.call.return_value = 500
 
-        with patch.object(self.mock_web3.eth, 'contract', return_value=mock_contract):
-            # Use a valid mock address
-            valid_address = "0x" + "a" * 40
-            result = _check_eigenlayer_deposit_cap(self.mock_web3, valid_address, 500)
-            assert result is True
+        result = _check_eigenlayer_deposit_cap(mock_contract, 500)
+        assert result is True
 
     def test_check_eigenlayer_deposit_cap_exceeds_limits(self) -> None:
         """Test deposit cap check when exceeding limits."""
@@ -99,19 +99,16 @@ class TestEigenLayerModule:
         mock_contract.functions.maxTotalDeposits.return_value.call.return_value = 2000
         mock_contract.functions.underlyingToSharesView.return_value.call.return_value = 500
 
-        with patch.object(self.mock_web3.eth, 'contract', return_value=mock_contract):
-            valid_address = "0x" + "a" * 40
-            result = _check_eigenlayer_deposit_cap(self.mock_web3, valid_address, 500)
-            assert result is False
+        result = _check_eigenlayer_deposit_cap(mock_contract, 500)
+        assert result is False
 
     def test_check_eigenlayer_deposit_cap_contract_error(self) -> None:
         """Test deposit cap check with contract error."""
         mock_contract = MagicMock()
         mock_contract.functions.totalShares.return_value.call.side_effect = Exception("Contract error")
 
-        with patch.object(self.mock_web3.eth, 'contract', return_value=mock_contract):
-            with pytest.raises(EigenLayerRestakeError):
-                _check_eigenlayer_deposit_cap(self.mock_web3, "0xStrategyAddress", 1000000000000000000)
+        with pytest.raises(EigenLayerRestakeError):
+            _check_eigenlayer_deposit_cap(mock_contract, 1000000000000000000)
 
     @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
     def test_restake_lst_steth_success(self, mock_load_abi: Any) -> None:
@@ -134,12 +131,13 @@ class TestEigenLayerModule:
             mock_token_contract.functions.balanceOf.return_value.call.return_value = 2000000000000000000
             mock_token_contract.functions.allowance.return_value.call.return_value = 0
 
-            mock_strategy_contract_internal = MagicMock()
-            mock_strategy_contract_internal.functions.totalShares.return_value.call.return_value = 1000
-            mock_strategy_contract_internal.functions.maxTotalDeposits.return_value.call.return_value = 2000
+            # The cached strategy contract doubles as the cap-check contract
+            # for stETH (same address and ABI file).
+            mock_strategy_contract.functions.totalShares.return_value.call.return_value = 1000
+            mock_strategy_contract.functions.maxTotalDeposits.return_value.call.return_value = 2000
 
             self.mock_web3.eth.contract.side_effect = [
-                mock_token_contract, mock_strategy_contract, mock_strategy_contract_internal
+                mock_token_contract, mock_strategy_contract
             ]
 
             mock_token_contract.functions.approve.return_value.build_transaction.return_value = {"data": "0x"}
@@ -172,12 +170,12 @@ class TestEigenLayerModule:
             mock_token_contract.functions.balanceOf.return_value.call.return_value = 2000000000000000000
             mock_token_contract.functions.allowance.return_value.call.return_value = 0
 
-            mock_strategy_contract_internal = MagicMock()
-            mock_strategy_contract_internal.functions.totalShares.return_value.call.return_value = 1000
-            mock_strategy_contract_internal.functions.maxTotalDeposits.return_value.call.return_value = 2000
+            # The cap check runs against the restake's own strategy contract.
+            mock_strategy_contract.functions.totalShares.return_value.call.return_value = 1000
+            mock_strategy_contract.functions.maxTotalDeposits.return_value.call.return_value = 2000
 
             self.mock_web3.eth.contract.side_effect = [
-                mock_token_contract, mock_strategy_contract, mock_strategy_contract_internal
+                mock_token_contract, mock_strategy_contract
             ]
 
             mock_token_contract.functions.approve.return_value.build_transaction.return_value = {"data": "0x"}
@@ -268,12 +266,11 @@ class TestEigenLayerModule:
             mock_token_contract.functions.balanceOf.return_value.call.return_value = 2000000000000000000
             mock_token_contract.functions.allowance.return_value.call.return_value = 0
 
-            mock_strategy_contract_internal = MagicMock()
-            mock_strategy_contract_internal.functions.totalShares.return_value.call.return_value = 1000
-            mock_strategy_contract_internal.functions.maxTotalDeposits.return_value.call.return_value = 2000
+            mock_strategy_contract.functions.totalShares.return_value.call.return_value = 1000
+            mock_strategy_contract.functions.maxTotalDeposits.return_value.call.return_value = 2000
 
             self.mock_web3.eth.contract.side_effect = [
-                mock_token_contract, mock_strategy_contract, mock_strategy_contract_internal
+                mock_token_contract, mock_strategy_contract
             ]
 
             mock_token_contract.functions.approve.return_value.build_transaction.return_value = {"data": "0x"}
@@ -307,12 +304,11 @@ class TestEigenLayerModule:
             mock_token_contract.functions.balanceOf.return_value.call.return_value = 2000000000000000000
             mock_token_contract.functions.allowance.return_value.call.return_value = 0
 
-            mock_strategy_contract_internal = MagicMock()
-            mock_strategy_contract_internal.functions.totalShares.return_value.call.return_value = 1000
-            mock_strategy_contract_internal.functions.maxTotalDeposits.return_value.call.return_value = 2000
+            mock_strategy_contract.functions.totalShares.return_value.call.return_value = 1000
+            mock_strategy_contract.functions.maxTotalDeposits.return_value.call.return_value = 2000
 
             self.mock_web3.eth.contract.side_effect = [
-                mock_token_contract, mock_strategy_contract, mock_strategy_contract_internal
+                mock_token_contract, mock_strategy_contract
             ]
 
             mock_token_contract.functions.approve.return_value.build_transaction.return_value = {"data": "0x"}
@@ -340,15 +336,21 @@ class TestEigenLayerModule:
                     self.mock_web3, self.private_key, "stETH", 1000000000000000000
                 )
 
-    def test_get_eigenlayer_lst_strategy_details_unknown_lst_fallback(self) -> None:
-        """Test getting strategy details for unknown LST that passes initial check."""
-        # This test covers the unreachable else branch in line 80
-        # We need to patch the LST_TOKENS to include an unknown symbol temporarily
-        with patch("airdrops.protocols.eigenlayer.eigenlayer.LST_TOKENS", {"UNKNOWN": "0xtest"}):
-            with patch("airdrops.protocols.eigenlayer.eigenlayer.LST_STRATEGIES", {}):
-                with pytest.raises(KeyError):
-                    # This will fail at LST_STRATEGIES lookup, but shows the code path
-                    _get_eigenlayer_lst_strategy_details("UNKNOWN")
+    def test_get_eigenlayer_lst_strategy_details_from_config_table(self) -> None:
+        """Test that strategy details come straight from LST_ASSET_DETAILS."""
+        custom_details = {
+            "token_address": "0xtest",
+            "strategy_address": "0xstrategy",
+            "token_abi_file": "ERC20.json",
+            "strategy_abi_file": "Custom.json",
+        }
+        with patch(
+            "airdrops.protocols.eigenlayer.eigenlayer.LST_ASSET_DETAILS",
+            {"CUSTOM": custom_details},
+        ):
+            assert _get_eigenlayer_lst_strategy_details("CUSTOM") is custom_details
+            with pytest.raises(UnsupportedLSTError):
+                _get_eigenlayer_lst_strategy_details("stETH")
 
     @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
     @patch("airdrops.protocols.eigenlayer.eigenlayer._check_eigenlayer_deposit_cap")
@@ -433,39 +435,29 @@ class TestEigenLayerModule:
         details = _get_eigenlayer_lst_strategy_details("rETH")
 
         assert details["token_address"] == "0xae78736Cd615f374D3085123A210448E74Fc6393"
-        assert details["strategy_address"] == "0x1BeE69b7dFFfA4E2d53C2A2Df135C34A2B5202c3"
+        assert details["strategy_address"] == "0x1BEe69b7DFffa4E2D53C2a2dF135c34a2B5202c3"
         assert details["token_abi_file"] == "ERC20.json"
         assert details["strategy_abi_file"] == "StrategyBaseTVLLimits_rETH.json"
 
-    @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
-    def test_check_eigenlayer_deposit_cap_edge_case_exact_limit(self, mock_load_abi: Any) -> None:
+    def test_check_eigenlayer_deposit_cap_edge_case_exact_limit(self) -> None:
         """Test deposit cap check when deposit exactly reaches the limit."""
-        mock_load_abi.return_value = [{"name": "test"}]
-
         mock_contract = MagicMock()
         mock_contract.functions.totalShares.return_value.call.return_value = 1500
         mock_contract.functions.maxTotalDeposits.return_value.call.return_value = 2000
 
-        with patch.object(self.mock_web3.eth, 'contract', return_value=mock_contract):
-            valid_address = "0x" + "a" * 40
-            # Deposit amount that exactly reaches the limit
-            result = _check_eigenlayer_deposit_cap(self.mock_web3, valid_address, 500)
-            assert result is True
+        # Deposit amount that exactly reaches the limit
+        result = _check_eigenlayer_deposit_cap(mock_contract, 500)
+        assert result is True
 
-    @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
-    def test_check_eigenlayer_deposit_cap_edge_case_exceeds_by_one(self, mock_load_abi: Any) -> None:
+    def test_check_eigenlayer_deposit_cap_edge_case_exceeds_by_one(self) -> None:
         """Test deposit cap check when deposit exceeds limit by one."""
-        mock_load_abi.return_value = [{"name": "test"}]
-
         mock_contract = MagicMock()
         mock_contract.functions.totalShares.return_value.call.return_value = 1500
         mock_contract.functions.maxTotalDeposits.return_value.call.return_value = 2000
 
-        with patch.object(self.mock_web3.eth, 'contract', return_value=mock_contract):
-            valid_address = "0x" + "a" * 40
-            # Deposit amount that exceeds the limit by 1
-            result = _check_eigenlayer_deposit_cap(self.mock_web3, valid_address, 501)
-            assert result is False
+        # Deposit amount that exceeds the limit by 1
+        result = _check_eigenlayer_deposit_cap(mock_contract, 501)
+        assert result is False
 
     @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
     def test_restake_lst_web3_connection_error(self, mock_load_abi: Any) -> None:
@@ -585,16 +577,16 @@ class TestEigenLayerModule:
             )
 
     @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
-    def test_check_eigenlayer_deposit_cap_contract_creation_failure(self, mock_load_abi: Any) -> None:
-        """Test deposit cap check with contract creation failure."""
+    def test_check_eigenlayer_deposit_cap_call_failure(self, mock_load_abi: Any) -> None:
+        """Test deposit cap check when the cap read reverts."""
         mock_load_abi.return_value = [{"name": "test"}]
 
-        # Use a valid hex address but mock the contract creation to fail
-        valid_hex_address = "0x" + "a" * 40
-        self.mock_web3.eth.contract.side_effect = Exception("Invalid contract address")
+        mock_contract = MagicMock()
+        mock_contract.functions.maxTotalDeposits.return_value.call.side_effect = \
+            Exception("Invalid contract address")
 
         with pytest.raises(EigenLayerRestakeError, match="Failed to check deposit cap: Invalid contract address"):
-            _check_eigenlayer_deposit_cap(self.mock_web3, valid_hex_address, 1000)
+            _check_eigenlayer_deposit_cap(mock_contract, 1000)
 
     @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
     @patch("airdrops.protocols.eigenlayer.eigenlayer._check_eigenlayer_deposit_cap")
@@ -625,3 +617,247 @@ class TestEigenLayerModule:
                 restake_lst(
                     self.mock_web3, self.private_key, "stETH", 1000000000000000000
                 )
+
+    def _make_async_web3(self) -> MagicMock:
+        """Build an AsyncWeb3-shaped mock for restake_lst_async tests."""
+        async def _gas_price() -> int:
+            return 20000000000
+
+        w3 = MagicMock()
+        w3.eth.account.from_key.return_value = self.mock_account
+        # A real SignedTransaction so an attribute typo in the code under
+        # test raises instead of being absorbed by a permissive mock.
+        w3.eth.account.sign_transaction.return_value = SignedTransaction(
+            raw_transaction=b"0xraw", hash=b"", r=0, s=0, v=0
+        )
+        w3.eth.gas_price = _gas_price()
+        w3.eth.get_transaction_count = AsyncMock(return_value=42)
+        w3.eth.send_raw_transaction = AsyncMock(side_effect=[
+            MagicMock(hex=lambda: "0xapprove_hash"),
+            MagicMock(hex=lambda: "0xdeposit_hash"),
+        ])
+        receipt_mock = MagicMock()
+        receipt_mock.__getitem__.side_effect = lambda key: 1 if key == 'status' else None
+        w3.eth.wait_for_transaction_receipt = AsyncMock(return_value=receipt_mock)
+        return w3
+
+    @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
+    def test_restake_lst_async_success(self, mock_load_abi: Any) -> None:
+        """Test successful async restaking with gathered pre-flight reads."""
+        mock_load_abi.return_value = [{"name": "test"}]
+        w3 = self._make_async_web3()
+
+        mock_token_contract = MagicMock()
+        mock_strategy_contract = MagicMock()
+        mock_token_contract.functions.balanceOf.return_value.call = AsyncMock(return_value=2000)
+        mock_token_contract.functions.allowance.return_value.call = AsyncMock(return_value=0)
+        mock_strategy_contract.functions.totalShares.return_value.call = AsyncMock(return_value=1000)
+        mock_strategy_contract.functions.maxTotalDeposits.return_value.call = AsyncMock(return_value=5000)
+        mock_token_contract.functions.approve.return_value.build_transaction = \
+            AsyncMock(return_value={"data": "0x"})
+        mock_strategy_contract.functions.deposit.return_value.build_transaction = \
+            AsyncMock(return_value={"data": "0x"})
+        w3.eth.contract.side_effect = [mock_token_contract, mock_strategy_contract]
+
+        success, result = asyncio.run(
+            restake_lst_async(w3, self.private_key, "stETH", 1000)
+        )
+
+        assert success is True
+        assert result == "0xdeposit_hash"
+
+    @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
+    def test_restake_lst_async_deposit_cap_reached(self, mock_load_abi: Any) -> None:
+        """Test async restaking when the deposit would exceed the cap."""
+        mock_load_abi.return_value = [{"name": "test"}]
+        w3 = self._make_async_web3()
+
+        mock_token_contract = MagicMock()
+        mock_strategy_contract = MagicMock()
+        mock_token_contract.functions.balanceOf.return_value.call = AsyncMock(return_value=2000)
+        mock_token_contract.functions.allowance.return_value.call = AsyncMock(return_value=0)
+        mock_strategy_contract.functions.totalShares.return_value.call = AsyncMock(return_value=1800)
+        mock_strategy_contract.functions.maxTotalDeposits.return_value.call = AsyncMock(return_value=2000)
+        w3.eth.contract.side_effect = [mock_token_contract, mock_strategy_contract]
+
+        with pytest.raises(DepositCapReachedError, match="Deposit would exceed strategy cap"):
+            asyncio.run(restake_lst_async(w3, self.private_key, "stETH", 1000))
+
+    def test_build_provider_uses_pooled_session(self) -> None:
+        """Test that _build_provider mounts a pooled Keep-Alive session."""
+        from airdrops.protocols.eigenlayer.eigenlayer import _build_provider
+
+        provider = _build_provider("https://example.invalid")
+
+        import requests
+        session = provider._request_session_manager.cache_and_return_session(
+            "https://example.invalid"
+        )
+        assert isinstance(session, requests.Session)
+        adapter = session.get_adapter("https://example.invalid")
+        assert adapter._pool_maxsize == 50
+
+    def test_get_gas_params_fee_history_and_cache(self) -> None:
+        """Test EIP-1559 fee computation and the short-TTL snapshot cache."""
+        from airdrops.protocols.eigenlayer.eigenlayer import _fee_cache, _get_gas_params
+
+        w3 = MagicMock()
+        w3.eth.chain_id = 99999
+        w3.eth.fee_history.return_value = {
+            "baseFeePerGas": [100, 110],
+            "reward": [[5], [7]],
+        }
+        _fee_cache.pop(99999, None)
+        try:
+            params = _get_gas_params(w3)
+            assert params == {"maxFeePerGas": 227, "maxPriorityFeePerGas": 7}
+
+            # A second call within the TTL reuses the snapshot without an RPC.
+            assert _get_gas_params(w3) is params
+            assert w3.eth.fee_history.call_count == 1
+        finally:
+            _fee_cache.pop(99999, None)
+
+    def test_get_gas_params_legacy_fallback(self) -> None:
+        """Test fallback to legacy gasPrice when fee history is unsupported."""
+        from airdrops.protocols.eigenlayer.eigenlayer import _get_gas_params
+
+        w3 = MagicMock()
+        w3.eth.chain_id = 99998
+        w3.eth.fee_history.side_effect = ValueError("method not found")
+        w3.eth.gas_price = 20000000000
+
+        assert _get_gas_params(w3) == {"gasPrice": 20000000000}
+
+    @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
+    @patch("airdrops.protocols.eigenlayer.eigenlayer._check_eigenlayer_deposit_cap")
+    def test_restake_lst_infinite_approve(self, mock_cap_check: Any, mock_load_abi: Any) -> None:
+        """Test that the default approval is for the maximum uint256."""
+        from airdrops.protocols.eigenlayer.eigenlayer import MAX_UINT256
+
+        with patch.object(self.mock_web3.eth.account, 'sign_transaction') as mock_sign_transaction, \
+             patch.object(self.mock_web3.eth, 'send_raw_transaction') as mock_send_raw_transaction:
+
+            mock_load_abi.return_value = [{"name": "test"}]
+            mock_cap_check.return_value = True
+            mock_sign_transaction.return_value = MagicMock(rawTransaction="0xraw")
+            mock_send_raw_transaction.return_value = MagicMock(hex=lambda: "0xdeposit_hash")
+
+            receipt_mock = MagicMock()
+            receipt_mock.__getitem__.side_effect = lambda key: 1 if key == 'status' else None
+            self.mock_web3.eth.wait_for_transaction_receipt.return_value = receipt_mock
+
+            mock_token_contract = MagicMock()
+            mock_strategy_contract = MagicMock()
+            mock_token_contract.functions.balanceOf.return_value.call.return_value = 2000
+            mock_token_contract.functions.allowance.return_value.call.return_value = 0
+            mock_token_contract.functions.approve.return_value.build_transaction.return_value = {"data": "0x"}
+            mock_strategy_contract.functions.deposit.return_value.build_transaction.return_value = {"data": "0x"}
+            self.mock_web3.eth.contract.side_effect = [mock_token_contract, mock_strategy_contract]
+
+            success, _ = restake_lst(self.mock_web3, self.private_key, "stETH", 1000)
+
+            assert success is True
+            mock_token_contract.functions.approve.assert_called_once_with(
+                "0x93C4B944d05dfE6DF72A2751b1A0541d03217475", MAX_UINT256
+            )
+
+            # An exact approval is still available when requested.
+            mock_token_contract.functions.approve.reset_mock()
+            self.mock_web3.eth.contract.side_effect = [mock_token_contract, mock_strategy_contract]
+            restake_lst(self.mock_web3, self.private_key, "stETH", 1000, infinite_approve=False)
+            mock_token_contract.functions.approve.assert_called_once_with(
+                "0x93C4B944d05dfE6DF72A2751b1A0541d03217475", 1000
+            )
+
+    def test_restake_lst_batch_dispatches_jobs_in_order(self) -> None:
+        """Test that batch restaking returns per-job results in job order."""
+        from airdrops.protocols.eigenlayer.eigenlayer import restake_lst_batch
+
+        jobs = [
+            ("0x" + "1" * 64, "stETH", 1000),
+            ("0x" + "2" * 64, "rETH", 2000),
+        ]
+
+        def _fake_restake(web3_eth: Any, private_key: str, lst_symbol: str,
+                          amount: int, infinite_approve: bool = True) -> Any:
+            if lst_symbol == "rETH":
+                raise EigenLayerRestakeError("boom")
+            return True, "0xhash"
+
+        with patch("airdrops.protocols.eigenlayer.eigenlayer.restake_lst",
+                   side_effect=_fake_restake):
+            results = restake_lst_batch(self.mock_web3, jobs)
+
+        assert results == [(True, "0xhash"), (False, "boom")]
+
+    def test_restake_lst_batch_empty(self) -> None:
+        """Test batch restaking with no jobs."""
+        from airdrops.protocols.eigenlayer.eigenlayer import restake_lst_batch
+
+        assert restake_lst_batch(self.mock_web3, []) == []
+
+    @patch("airdrops.protocols.eigenlayer.eigenlayer._load_abi")
+    @patch("airdrops.protocols.eigenlayer.eigenlayer._check_eigenlayer_deposit_cap")
+    def test_restake_lst_raw_hash(self, mock_cap_check: Any, mock_load_abi: Any) -> None:
+        """Test that raw_hash=True returns the hash object unstringified."""
+        with patch.object(self.mock_web3.eth.account, 'sign_transaction') as mock_sign_transaction, \
+             patch.object(self.mock_web3.eth, 'send_raw_transaction') as mock_send_raw_transaction:
+
+            mock_load_abi.return_value = [{"name": "test"}]
+            mock_cap_check.return_value = True
+            mock_sign_transaction.return_value = MagicMock(rawTransaction="0xraw")
+            deposit_hash = MagicMock(hex=lambda: "0xdeposit_hash")
+            mock_send_raw_transaction.return_value = deposit_hash
+
+            receipt_mock = MagicMock()
+            receipt_mock.__getitem__.side_effect = lambda key: 1 if key == 'status' else None
+            self.mock_web3.eth.wait_for_transaction_receipt.return_value = receipt_mock
+
+            mock_token_contract = MagicMock()
+            mock_strategy_contract = MagicMock()
+            mock_token_contract.functions.balanceOf.return_value.call.return_value = 2000
+            mock_token_contract.functions.allowance.return_value.call.return_value = 2000
+            mock_strategy_contract.functions.deposit.return_value.build_transaction.return_value = {"data": "0x"}
+            self.mock_web3.eth.contract.side_effect = [mock_token_contract, mock_strategy_contract]
+
+            success, result = restake_lst(
+                self.mock_web3, self.private_key, "stETH", 1000, raw_hash=True
+            )
+
+            assert success is True
+            assert result is deposit_hash
+
+    def test_encode_deposit_calldata_cached(self) -> None:
+        """Test that deposit calldata is encoded once per (strategy, token, amount)."""
+        from airdrops.protocols.eigenlayer.eigenlayer import (
+            _DEPOSIT_CALLDATA_CACHE,
+            _encode_deposit_calldata,
+        )
+
+        strategy = MagicMock()
+        strategy.address = "0xStrategy"
+        strategy.encode_abi.return_value = "0xcalldata"
+
+        try:
+            first = _encode_deposit_calldata(strategy, "0xToken", 1000)
+            second = _encode_deposit_calldata(strategy, "0xToken", 1000)
+
+            assert first == "0xcalldata"
+            assert second is first
+            strategy.encode_abi.assert_called_once_with("deposit", args=["0xToken", 1000])
+        finally:
+            _DEPOSIT_CALLDATA_CACHE.pop(("0xStrategy", "0xToken", 1000), None)
+
+    def test_lst_symbol_enum_accepts_member_and_string(self) -> None:
+        """Test LSTSymbol coercion at the restake entry point."""
+        from airdrops.protocols.eigenlayer.eigenlayer import LSTSymbol
+
+        assert LSTSymbol("stETH") is LSTSymbol.STETH
+        assert LSTSymbol.RETH.value == "rETH"
+        with pytest.raises(ValueError):
+            LSTSymbol("INVALID")
+
+        # restake_lst accepts the enum member directly.
+        with pytest.raises(EigenLayerRestakeError, match="Amount must be positive"):
+            restake_lst(self.mock_web3, self.private_key, LSTSymbol.STETH, 0)
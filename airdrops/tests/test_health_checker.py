@@ -5,6 +5,7 @@ This module provides comprehensive tests for the HealthChecker class,
 covering positive, edge, and failure cases for all health check functionality.
 """
 
+import asyncio
 import pytest
 import time
 from unittest.mock import Mock, patch, MagicMock
@@ -82,12 +83,10 @@ class TestHealthChecker:
         alerter.active_alerts = {}
 
         with patch('psutil.cpu_percent', return_value=50.0), \
-             patch('psutil.virtual_memory') as mock_memory, \
-             patch('psutil.disk_usage') as mock_disk:
-
-            mock_memory.return_value.percent = 60.0
-            mock_disk.return_value.used = 500000000
-            mock_disk.return_value.total = 1000000000
+             patch.object(HealthChecker, '_read_memory_percent',
+                          return_value=60.0), \
+             patch.object(HealthChecker, '_read_disk_percent',
+                          return_value=50.0):
 
             health_status = health_checker.check_system_health(
                 risk_manager=risk_manager,
@@ -111,12 +110,10 @@ class TestHealthChecker:
         risk_manager.risk_limits = Mock()
 
         with patch('psutil.cpu_percent', return_value=50.0), \
-             patch('psutil.virtual_memory') as mock_memory, \
-             patch('psutil.disk_usage') as mock_disk:
-
-            mock_memory.return_value.percent = 60.0
-            mock_disk.return_value.used = 500000000
-            mock_disk.return_value.total = 1000000000
+             patch.object(HealthChecker, '_read_memory_percent',
+                          return_value=60.0), \
+             patch.object(HealthChecker, '_read_disk_percent',
+                          return_value=50.0):
 
             health_status = health_checker.check_system_health(
                 risk_manager=risk_manager
@@ -137,12 +134,10 @@ class TestHealthChecker:
         health_checker = HealthChecker()
 
         with patch('psutil.cpu_percent', return_value=85.0), \
-             patch('psutil.virtual_memory') as mock_memory, \
-             patch('psutil.disk_usage') as mock_disk:
-
-            mock_memory.return_value.percent = 60.0
-            mock_disk.return_value.used = 500000000
-            mock_disk.return_value.total = 1000000000
+             patch.object(HealthChecker, '_read_memory_percent',
+                          return_value=60.0), \
+             patch.object(HealthChecker, '_read_disk_percent',
+                          return_value=50.0):
 
             health_status = health_checker.check_system_health()
 
@@ -161,12 +156,10 @@ class TestHealthChecker:
         health_checker = HealthChecker()
 
         with patch('psutil.cpu_percent', return_value=50.0), \
-             patch('psutil.virtual_memory') as mock_memory, \
-             patch('psutil.disk_usage') as mock_disk:
-
-            mock_memory.return_value.percent = 96.0
-            mock_disk.return_value.used = 500000000
-            mock_disk.return_value.total = 1000000000
+             patch.object(HealthChecker, '_read_memory_percent',
+                          return_value=96.0), \
+             patch.object(HealthChecker, '_read_disk_percent',
+                          return_value=50.0):
 
             health_status = health_checker.check_system_health()
 
@@ -185,12 +178,10 @@ class TestHealthChecker:
         health_checker = HealthChecker()
 
         with patch('psutil.cpu_percent', return_value=75.0), \
-             patch('psutil.virtual_memory') as mock_memory, \
-             patch('psutil.disk_usage') as mock_disk:
-
-            mock_memory.return_value.percent = 70.0
-            mock_disk.return_value.used = 600000000
-            mock_disk.return_value.total = 1000000000
+             patch.object(HealthChecker, '_read_memory_percent',
+                          return_value=70.0), \
+             patch.object(HealthChecker, '_read_disk_percent',
+                          return_value=60.0):
 
             component_health = health_checker.check_component_health("system_resources")
 
@@ -470,12 +461,71 @@ class TestHealthChecker:
         overall_status = health_checker._determine_overall_status([])
         assert overall_status == HealthStatus.CRITICAL
 
+    def test_check_system_health_async_coalesces_concurrent_calls(self):
+        """Test concurrent async health checks share one probe sweep."""
+        health_checker = HealthChecker()
+        probe_calls = []
+
+        def slow_resources(now=None):
+            probe_calls.append(now)
+            time.sleep(0.05)
+            return ComponentHealth(
+                "system_resources", HealthStatus.OK, "OK", now, {}
+            )
+
+        async def run_pair():
+            return await asyncio.gather(
+                health_checker.check_system_health_async(use_cache=False),
+                health_checker.check_system_health_async(use_cache=False),
+            )
+
+        with patch.object(
+            health_checker, '_check_system_resources',
+            side_effect=slow_resources
+        ):
+            first, second = asyncio.run(run_pair())
+
+        assert len(probe_calls) == 1
+        assert first is second
+        assert first.overall_status == HealthStatus.OK
+
+    def test_check_system_health_async_matches_sync_component_order(self):
+        """Test async and sync paths order components identically."""
+        health_checker = HealthChecker()
+        risk_manager = Mock()
+        risk_manager.circuit_breaker_active = False
+        scheduler = Mock()
+        scheduler._running = True
+        scheduler._task_definitions = {"task1": Mock()}
+
+        with patch('psutil.cpu_percent', return_value=10.0), \
+                patch('psutil.virtual_memory') as mock_memory, \
+                patch('psutil.disk_usage') as mock_disk:
+            mock_memory.return_value.percent = 20.0
+            mock_disk.return_value.percent = 30.0
+
+            sync_health = health_checker.check_system_health(
+                risk_manager=risk_manager, scheduler=scheduler,
+                use_cache=False
+            )
+            async_health = asyncio.run(
+                health_checker.check_system_health_async(
+                    risk_manager=risk_manager, scheduler=scheduler,
+                    use_cache=False
+                )
+            )
+
+        assert (
+            [c.component_name for c in async_health.components]
+            == [c.component_name for c in sync_health.components]
+        )
+
     def test_health_endpoint_success(self):
         """Test health endpoint returns successful response."""
         health_checker = HealthChecker()
         client = TestClient(health_checker.app)
 
-        with patch.object(health_checker, 'check_system_health') as mock_check:
+        with patch.object(health_checker, 'check_system_health_async') as mock_check:
             mock_health = SystemHealth(
                 overall_status=HealthStatus.OK,
                 timestamp=time.time(),
@@ -499,7 +549,7 @@ class TestHealthChecker:
         health_checker = HealthChecker()
         client = TestClient(health_checker.app)
 
-        with patch.object(health_checker, 'check_system_health') as mock_check:
+        with patch.object(health_checker, 'check_system_health_async') as mock_check:
             mock_health = SystemHealth(
                 overall_status=HealthStatus.WARNING,
                 timestamp=time.time(),
@@ -521,7 +571,7 @@ class TestHealthChecker:
         health_checker = HealthChecker()
         client = TestClient(health_checker.app)
 
-        with patch.object(health_checker, 'check_system_health') as mock_check:
+        with patch.object(health_checker, 'check_system_health_async') as mock_check:
             mock_health = SystemHealth(
                 overall_status=HealthStatus.CRITICAL,
                 timestamp=time.time(),
@@ -543,7 +593,7 @@ class TestHealthChecker:
         health_checker = HealthChecker()
         client = TestClient(health_checker.app)
 
-        with patch.object(health_checker, 'check_system_health') as mock_check:
+        with patch.object(health_checker, 'check_system_health_async') as mock_check:
             mock_check.side_effect = Exception("Test error")
 
             response = client.get("/health")
@@ -553,6 +603,57 @@ class TestHealthChecker:
         assert data["status"] == "CRITICAL"
         assert "error" in data
 
+    def test_health_endpoint_etag_not_modified(self):
+        """Test health endpoint returns 304 for a matching If-None-Match."""
+        health_checker = HealthChecker()
+        client = TestClient(health_checker.app)
+
+        with patch.object(health_checker, 'check_system_health_async') as mock_check:
+            mock_check.return_value = SystemHealth(
+                overall_status=HealthStatus.OK,
+                timestamp=time.time(),
+                components=[],
+                summary={"total_components": 0, "ok_count": 0, "warning_count": 0, "critical_count": 0}
+            )
+
+            first = client.get("/health")
+            etag = first.headers["etag"]
+            second = client.get("/health", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_liveness_endpoint(self):
+        """Test liveness endpoint returns 200 without component checks."""
+        health_checker = HealthChecker()
+        client = TestClient(health_checker.app)
+
+        with patch.object(health_checker, 'check_system_health_async') as mock_check:
+            response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+        mock_check.assert_not_called()
+
+    def test_readiness_endpoint_alias(self):
+        """Test /health/ready serves the same sweep as /health."""
+        health_checker = HealthChecker()
+        client = TestClient(health_checker.app)
+
+        with patch.object(health_checker, 'check_system_health_async') as mock_check:
+            mock_check.return_value = SystemHealth(
+                overall_status=HealthStatus.OK,
+                timestamp=time.time(),
+                components=[],
+                summary={"total_components": 0, "ok_count": 0, "warning_count": 0, "critical_count": 0}
+            )
+
+            response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "OK"
+
     def test_component_health_endpoint_success(self):
         """Test component health endpoint returns successful response."""
         health_checker = HealthChecker()
@@ -633,7 +734,10 @@ class TestHealthChecker:
                 health_checker.app,
                 host="127.0.0.1",
                 port=8001,
-                log_level="info"
+                log_level="warning",
+                loop="auto",
+                http="auto",
+                access_log=False
             )
 
     def test_start_server_exception_handling(self):
@@ -690,7 +794,8 @@ class TestEnums:
     """Test cases for enums."""
 
     def test_health_status_values(self):
-        """Test HealthStatus enum values."""
-        assert HealthStatus.OK.value == "OK"
-        assert HealthStatus.WARNING.value == "WARNING"
-        assert HealthStatus.CRITICAL.value == "CRITICAL"
+        """Test HealthStatus severity ordering and serialized names."""
+        assert HealthStatus.OK < HealthStatus.WARNING < HealthStatus.CRITICAL
+        assert HealthStatus.OK.name == "OK"
+        assert HealthStatus.WARNING.name == "WARNING"
+        assert HealthStatus.CRITICAL.name == "CRITICAL"
@@ -1,15 +1,26 @@
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from airdrops.protocols.hyperliquid import (
     spot_swap,
     stake_rotate,
     vault_cycle,
+    vault_cycle_sync,
     evm_roundtrip,
     perform_random_onchain,
+    _build_arbitrum_provider,
+    _usdc_contract,
+    _SharedPoller,
+    NonceManager,
+    TokenBucket,
+    configure_rate_limit,
+    clear_info_caches,
+    run_fleet,
     _deposit_to_l1,
     _poll_l1_deposit_confirmation,
     _withdraw_from_l1,
     _poll_arbitrum_withdrawal_confirmation,
+    _poll_arbitrum_withdrawals_batch,
     _execute_stake_rotate,
     _execute_vault_cycle,
     _execute_spot_swap,
@@ -18,6 +29,7 @@ from airdrops.protocols.hyperliquid import (
     _execute_query_meta,
     _execute_query_all_mids,
     _execute_query_clearing_house_state,
+    _execute_query_bundle,
 )
 import logging
 
@@ -79,14 +91,14 @@ def mock_info_agent():
     }
     mock_info.user_staking_delegations.return_value = [
         {
-            "validator": "0xvalidator1",
+            "validator": "0x1111111111111111111111111111111111111111",
             "amount": "1000000000000000000",
         }
     ]
     mock_info.validators.return_value = [
-        {"address": "0xvalidator1"},
-        {"address": "0xvalidator2"},
-        {"address": "0xvalidator3"},
+        {"address": "0x1111111111111111111111111111111111111111"},
+        {"address": "0x2222222222222222222222222222222222222222"},
+        {"address": "0x3333333333333333333333333333333333333333"},
     ]
     mock_info.all_mids.return_value = {"ETH": "3000.0", "BTC": "70000.0"}
     mock_info.clearing_house_state.return_value = {"status": "ok"}
@@ -246,6 +258,22 @@ def test_spot_swap_invalid_to_token(mock_exchange_agent, mock_info_agent):
     mock_exchange_agent.order.assert_not_called()
 
 
+def test_spot_swap_meta_cached_across_swaps(mock_exchange_agent, mock_info_agent):
+    """Test repeated swaps reuse the cached asset universe."""
+    for _ in range(2):
+        response = spot_swap(
+            mock_exchange_agent,
+            mock_info_agent,
+            "ETH",
+            "USDC",
+            0.01,
+            {"market": {}},
+        )
+        assert response["status"] == "ok"
+
+    mock_info_agent.meta.assert_called_once()
+
+
 def test_spot_swap_exchange_exception(mock_exchange_agent, mock_info_agent):
     """Test spot swap when exchange.order() raises an exception."""
     from_token = "ETH"
@@ -275,18 +303,18 @@ def test_stake_rotate_success(mock_exchange_agent, mock_info_agent):
     result = stake_rotate(
         mock_exchange_agent,
         mock_info_agent,
-        "0xvalidator1",
-        "0xvalidator2",
+        "0x1111111111111111111111111111111111111111",
+        "0x2222222222222222222222222222222222222222",
         1000000000000000000,
     )
 
     assert result is True
     mock_exchange_agent.unstake.assert_called_once_with(
-        validator_address="0xvalidator1",
+        validator_address="0x1111111111111111111111111111111111111111",
         amount_wei=1000000000000000000,
     )
     mock_exchange_agent.stake.assert_called_once_with(
-        validator_address="0xvalidator2",
+        validator_address="0x2222222222222222222222222222222222222222",
         amount_wei=1000000000000000000,
     )
 
@@ -298,8 +326,8 @@ def test_stake_rotate_unstake_failure(mock_exchange_agent, mock_info_agent):
     result = stake_rotate(
         mock_exchange_agent,
         mock_info_agent,
-        "0xvalidator1",
-        "0xvalidator2",
+        "0x1111111111111111111111111111111111111111",
+        "0x2222222222222222222222222222222222222222",
         1000000000000000000,
     )
 
@@ -315,8 +343,8 @@ def test_stake_rotate_stake_failure(mock_exchange_agent, mock_info_agent):
     result = stake_rotate(
         mock_exchange_agent,
         mock_info_agent,
-        "0xvalidator1",
-        "0xvalidator2",
+        "0x1111111111111111111111111111111111111111",
+        "0x2222222222222222222222222222222222222222",
         1000000000000000000,
     )
 
@@ -332,18 +360,78 @@ def test_stake_rotate_exception(mock_exchange_agent, mock_info_agent):
     result = stake_rotate(
         mock_exchange_agent,
         mock_info_agent,
-        "0xvalidator1",
-        "0xvalidator2",
+        "0x1111111111111111111111111111111111111111",
+        "0x2222222222222222222222222222222222222222",
         1000000000000000000,
     )
 
     assert result is False
 
 
-@patch('time.sleep')
+def _mock_hyperliquid_sdk_modules():
+    """Fake SDK modules so the batched stake-rotate path imports them."""
+    signing = Mock()
+    signing.get_timestamp_ms.return_value = 1700000000000
+    signing.sign_l1_action.return_value = {"r": "0x0", "s": "0x0", "v": 27}
+    constants = Mock()
+    constants.MAINNET_API_URL = "https://api.hyperliquid.xyz"
+    return {
+        'hyperliquid': Mock(),
+        'hyperliquid.utils': Mock(),
+        'hyperliquid.utils.signing': signing,
+        'hyperliquid.utils.constants': constants,
+    }
+
+
+def test_stake_rotate_batched_success(mock_exchange_agent, mock_info_agent):
+    """Test the batched path rotates in one request when the SDK accepts."""
+    mock_exchange_agent.base_url = "https://api.hyperliquid.xyz"
+    mock_exchange_agent._post_action.return_value = {"status": "ok"}
+
+    with patch.dict('sys.modules', _mock_hyperliquid_sdk_modules()):
+        result = stake_rotate(
+            mock_exchange_agent,
+            mock_info_agent,
+            "0x1111111111111111111111111111111111111111",
+            "0x2222222222222222222222222222222222222222",
+            1000000000000000000,
+        )
+
+    assert result is True
+    mock_exchange_agent._post_action.assert_called_once()
+    mock_exchange_agent.unstake.assert_not_called()
+    mock_exchange_agent.stake.assert_not_called()
+
+
+def test_stake_rotate_batched_rejection_falls_back(
+    mock_exchange_agent, mock_info_agent
+):
+    """Test a rejected batch falls back to the sequential legs."""
+    mock_exchange_agent.base_url = "https://api.hyperliquid.xyz"
+    mock_exchange_agent._post_action.return_value = {
+        "status": "err",
+        "response": "Unknown action type",
+    }
+
+    with patch.dict('sys.modules', _mock_hyperliquid_sdk_modules()):
+        result = stake_rotate(
+            mock_exchange_agent,
+            mock_info_agent,
+            "0x1111111111111111111111111111111111111111",
+            "0x2222222222222222222222222222222222222222",
+            1000000000000000000,
+        )
+
+    assert result is True
+    mock_exchange_agent._post_action.assert_called_once()
+    mock_exchange_agent.unstake.assert_called_once()
+    mock_exchange_agent.stake.assert_called_once()
+
+
+@patch('asyncio.sleep', new_callable=AsyncMock)
 def test_vault_cycle_success(mock_sleep, mock_exchange_agent, mock_info_agent):
     """Test successful vault cycle."""
-    result = vault_cycle(
+    result = asyncio.run(vault_cycle(
         mock_exchange_agent,
         mock_info_agent,
         "0x1234567890123456789012345678901234567890",
@@ -351,7 +439,7 @@ def test_vault_cycle_success(mock_sleep, mock_exchange_agent, mock_info_agent):
         max_deposit_usd_units=40_000_000,
         min_hold_seconds=1,
         max_hold_seconds=2,
-    )
+    ))
 
     assert result is True
     assert mock_exchange_agent.vault_transfer.call_count == 2
@@ -359,42 +447,59 @@ def test_vault_cycle_success(mock_sleep, mock_exchange_agent, mock_info_agent):
     mock_sleep.assert_called_once()
 
 
-@patch('time.sleep')
+@patch('asyncio.sleep', new_callable=AsyncMock)
+def test_vault_cycle_sync_wrapper(
+    mock_sleep, mock_exchange_agent, mock_info_agent
+):
+    """Test the synchronous wrapper runs the coroutine to completion."""
+    result = vault_cycle_sync(
+        mock_exchange_agent,
+        mock_info_agent,
+        "0x1234567890123456789012345678901234567890",
+        min_hold_seconds=1,
+        max_hold_seconds=2,
+    )
+
+    assert result is True
+    assert mock_exchange_agent.vault_transfer.call_count == 2
+
+
+@patch('asyncio.sleep', new_callable=AsyncMock)
 def test_vault_cycle_deposit_failure(
     mock_sleep, mock_exchange_agent, mock_info_agent
 ):
     """Test vault cycle when deposit fails."""
     mock_exchange_agent.vault_transfer.return_value = {"status": "error"}
 
-    result = vault_cycle(
+    result = asyncio.run(vault_cycle(
         mock_exchange_agent,
         mock_info_agent,
         "0x1234567890123456789012345678901234567890",
-    )
+    ))
 
     assert result is False
     mock_exchange_agent.vault_transfer.assert_called_once()
     mock_sleep.assert_not_called()
 
 
-@patch('time.sleep')
+@patch('asyncio.sleep', new_callable=AsyncMock)
 def test_vault_cycle_no_equity(mock_sleep, mock_exchange_agent, mock_info_agent):
     """Test vault cycle when no equity found."""
     mock_info_agent.user_vault_equities.return_value = []
 
-    result = vault_cycle(
+    result = asyncio.run(vault_cycle(
         mock_exchange_agent,
         mock_info_agent,
         "0x1234567890123456789012345678901234567890",
         min_hold_seconds=1,
         max_hold_seconds=2,
-    )
+    ))
 
     assert result is False
     mock_sleep.assert_called_once()
 
 
-@patch('time.sleep')
+@patch('asyncio.sleep', new_callable=AsyncMock)
 def test_vault_cycle_zero_equity(
     mock_sleep, mock_exchange_agent, mock_info_agent
 ):
@@ -406,23 +511,29 @@ def test_vault_cycle_zero_equity(
         }
     ]
 
-    result = vault_cycle(
+    result = asyncio.run(vault_cycle(
         mock_exchange_agent,
         mock_info_agent,
         "0x1234567890123456789012345678901234567890",
         min_hold_seconds=1,
         max_hold_seconds=2,
-    )
+    ))
 
     assert result is True
     mock_sleep.assert_called_once()
 
 
-@patch('airdrops.protocols.hyperliquid._poll_arbitrum_withdrawal_confirmation')
-@patch('airdrops.protocols.hyperliquid._withdraw_from_l1')
-@patch('time.sleep')
-@patch('airdrops.protocols.hyperliquid._poll_l1_deposit_confirmation')
-@patch('airdrops.protocols.hyperliquid._deposit_to_l1')
+@patch(
+    'airdrops.protocols.hyperliquid._poll_arbitrum_withdrawal_confirmation',
+    new_callable=AsyncMock,
+)
+@patch('airdrops.protocols.hyperliquid._withdraw_from_l1', new_callable=AsyncMock)
+@patch('asyncio.sleep', new_callable=AsyncMock)
+@patch(
+    'airdrops.protocols.hyperliquid._poll_l1_deposit_confirmation',
+    new_callable=AsyncMock,
+)
+@patch('airdrops.protocols.hyperliquid._deposit_to_l1', new_callable=AsyncMock)
 def test_evm_roundtrip_success(
     mock_deposit, mock_poll_deposit, mock_sleep, mock_withdraw,
     mock_poll_withdraw, mock_exchange_agent, mock_info_agent, mock_web3
@@ -433,7 +544,7 @@ def test_evm_roundtrip_success(
     mock_withdraw.return_value = True
     mock_poll_withdraw.return_value = True
 
-    result = evm_roundtrip(
+    result = asyncio.run(evm_roundtrip(
         mock_exchange_agent,
         mock_info_agent,
         mock_web3,
@@ -441,7 +552,7 @@ def test_evm_roundtrip_success(
         "0xprivatekey",
         25.0,
         l1_hold_duration_seconds=60,
-    )
+    ))
 
     assert result is True
     mock_deposit.assert_called_once()
@@ -455,48 +566,48 @@ def test_evm_roundtrip_amount_too_low(
     mock_exchange_agent, mock_info_agent, mock_web3
 ):
     """Test EVM roundtrip with amount below minimum."""
-    result = evm_roundtrip(
+    result = asyncio.run(evm_roundtrip(
         mock_exchange_agent,
         mock_info_agent,
         mock_web3,
         "0x1234567890123456789012345678901234567890",
         "0xprivatekey",
         4.0,
-    )
+    ))
 
     assert result is False
 
 
-@patch('airdrops.protocols.hyperliquid._deposit_to_l1')
+@patch('airdrops.protocols.hyperliquid._deposit_to_l1', new_callable=AsyncMock)
 def test_evm_roundtrip_deposit_failure(
     mock_deposit, mock_exchange_agent, mock_info_agent, mock_web3
 ):
     """Test EVM roundtrip when deposit fails."""
     mock_deposit.return_value = False
 
-    result = evm_roundtrip(
+    result = asyncio.run(evm_roundtrip(
         mock_exchange_agent,
         mock_info_agent,
         mock_web3,
         "0x1234567890123456789012345678901234567890",
         "0xprivatekey",
         25.0,
-    )
+    ))
 
     assert result is False
 
 
 def test_deposit_to_l1_success(mock_web3):
     """Test successful deposit to L1."""
-    result = _deposit_to_l1(
+    result = asyncio.run(_deposit_to_l1(
         mock_web3,
         "0x1234567890123456789012345678901234567890",
         "0xprivatekey",
         25.0,
-    )
+    ))
 
     assert result is True
-    mock_web3.eth.contract.assert_called_once()
+    mock_web3.eth.account.sign_transaction.assert_called_once()
     mock_web3.eth.send_raw_transaction.assert_called_once()
 
 
@@ -504,32 +615,99 @@ def test_deposit_to_l1_transaction_failure(mock_web3):
     """Test deposit to L1 when transaction fails."""
     mock_web3.eth.wait_for_transaction_receipt.return_value = {"status": 0}
 
-    result = _deposit_to_l1(
+    result = asyncio.run(_deposit_to_l1(
         mock_web3,
         "0x1234567890123456789012345678901234567890",
         "0xprivatekey",
         25.0,
-    )
+    ))
 
     assert result is False
 
 
+def test_usdc_contract_cached_per_web3(mock_web3):
+    """Test the USDC contract is built once and reused per Web3 instance."""
+    first = _usdc_contract(mock_web3)
+    second = _usdc_contract(mock_web3)
+
+    assert first is second
+    mock_web3.eth.contract.assert_called_once()
+
+
+def test_build_arbitrum_provider_uses_pooled_session():
+    """Test the Arbitrum provider reuses one pooled Keep-Alive session."""
+    url = "https://arb1.example.org/rpc"
+    provider = _build_arbitrum_provider(url)
+
+    session = provider._request_session_manager.cache_and_return_session(url)
+    adapter = session.get_adapter(url)
+    assert adapter._pool_maxsize == 64
+    assert adapter.max_retries.total == 3
+
+
+def test_build_arbitrum_web3_wires_pooled_provider():
+    """Test the Web3 factory sizes the pool for the concurrency budget."""
+    from web3 import Web3
+    from airdrops.protocols.hyperliquid import build_arbitrum_web3
+
+    url = "https://arb1.example.org/rpc"
+    w3 = build_arbitrum_web3(url, pool_size=8)
+
+    assert isinstance(w3, Web3)
+    session = w3.provider._request_session_manager.cache_and_return_session(url)
+    assert session.get_adapter(url)._pool_maxsize == 8
+
+
+def test_usdc_to_units_is_exact():
+    """Test the Decimal conversion does not lose units to float error."""
+    from airdrops.protocols.hyperliquid import _usdc_to_units
+
+    # int(0.29 * 10**6) == 289999 under binary float math
+    assert _usdc_to_units(0.29) == 290000
+    assert _usdc_to_units(25.0) == 25000000
+    assert _usdc_to_units("25.5") == 25500000
+
+
+def test_nonce_manager_reserves_sequential_nonces(mock_web3):
+    """Test concurrent reserves share one RPC and never collide."""
+    manager = NonceManager(mock_web3)
+    address = "0x1234567890123456789012345678901234567890"
+
+    async def reserve_three():
+        return await asyncio.gather(
+            manager.reserve(address),
+            manager.reserve(address),
+            manager.reserve(address),
+        )
+
+    nonces = asyncio.run(reserve_three())
+
+    assert nonces == [1, 2, 3]
+    mock_web3.eth.get_transaction_count.assert_called_once_with(address, "pending")
+
+    manager.invalidate(address)
+    assert asyncio.run(manager.reserve(address)) == 1
+    assert mock_web3.eth.get_transaction_count.call_count == 2
+
+
 def test_deposit_to_l1_exception(mock_web3):
     """Test deposit to L1 when exception occurs."""
-    mock_web3.eth.contract.side_effect = Exception("Web3 error")
+    mock_web3.eth.account.sign_transaction.side_effect = Exception(
+        "Web3 error"
+    )
 
-    result = _deposit_to_l1(
+    result = asyncio.run(_deposit_to_l1(
         mock_web3,
         "0x1234567890123456789012345678901234567890",
         "0xprivatekey",
         25.0,
-    )
+    ))
 
     assert result is False
 
 
-@patch('time.sleep')
-@patch('time.time')
+@patch('asyncio.sleep', new_callable=AsyncMock)
+@patch('airdrops.protocols.hyperliquid._monotonic')
 def test_poll_l1_deposit_confirmation_success(
     mock_time, mock_sleep, mock_info_agent
 ):
@@ -540,19 +718,42 @@ def test_poll_l1_deposit_confirmation_success(
         {"withdrawable": [{"coin": "USDC", "total": "125.0"}]},
     ]
 
-    result = _poll_l1_deposit_confirmation(
+    result = asyncio.run(_poll_l1_deposit_confirmation(
         mock_info_agent,
         "0x1234567890123456789012345678901234567890",
         25.0,
         10,
         300,
-    )
+    ))
+
+    assert result is True
+
+
+@patch(
+    'airdrops.protocols.hyperliquid._await_deposit_via_ws',
+    new=AsyncMock(return_value=False),
+)
+def test_poll_l1_deposit_ws_timeout_reconciles_balance(mock_info_agent):
+    """Test a missed WebSocket event is reconciled via a balance check."""
+    mock_info_agent.user_state.side_effect = [
+        {"withdrawable": [{"coin": "USDC", "total": "100.0"}]},
+        {"withdrawable": [{"coin": "USDC", "total": "125.0"}]},
+    ]
+
+    result = asyncio.run(_poll_l1_deposit_confirmation(
+        mock_info_agent,
+        "0x1234567890123456789012345678901234567890",
+        25.0,
+        10,
+        300,
+    ))
 
     assert result is True
+    assert mock_info_agent.user_state.call_count == 2
 
 
-@patch('time.sleep')
-@patch('time.time')
+@patch('asyncio.sleep', new_callable=AsyncMock)
+@patch('airdrops.protocols.hyperliquid._monotonic')
 def test_poll_l1_deposit_confirmation_timeout(
     mock_time, mock_sleep, mock_info_agent
 ):
@@ -562,20 +763,69 @@ def test_poll_l1_deposit_confirmation_timeout(
         "withdrawable": [{"coin": "USDC", "total": "100.0"}]
     }
 
-    result = _poll_l1_deposit_confirmation(
+    result = asyncio.run(_poll_l1_deposit_confirmation(
         mock_info_agent,
         "0x1234567890123456789012345678901234567890",
         25.0,
         10,
         300,
-    )
+    ))
 
     assert result is False
 
 
+@patch('asyncio.sleep', new_callable=AsyncMock)
+def test_shared_poller_coalesces_waiters(mock_sleep, mock_info_agent):
+    """Test concurrent waiters share one user_state call per tick."""
+    address = "0x1234567890123456789012345678901234567890"
+    mock_info_agent.user_state.side_effect = [
+        {"withdrawable": [{"coin": "USDC", "total": "100.0"}]},
+        {"withdrawable": [{"coin": "USDC", "total": "150.0"}]},
+    ]
+    poller = _SharedPoller(mock_info_agent)
+
+    async def wait_both():
+        return await asyncio.gather(
+            poller.usdc_at_least(address, 120.0, timeout_seconds=5),
+            poller.usdc_at_least(address, 150.0, timeout_seconds=5),
+        )
+
+    results = asyncio.run(wait_both())
+
+    assert results == [True, True]
+    assert mock_info_agent.user_state.call_count == 2
+
+
+@patch('asyncio.sleep', new_callable=AsyncMock)
+def test_token_bucket_throttles_after_burst(mock_sleep):
+    """Test the bucket sleeps only once the burst allowance is spent."""
+    bucket = TokenBucket(rate=10.0, burst=2)
+
+    async def take_three():
+        await bucket.acquire()
+        await bucket.acquire()
+        mock_sleep.assert_not_called()
+        await bucket.acquire()
+
+    asyncio.run(take_three())
+    mock_sleep.assert_called_once()
+
+
+def test_configure_rate_limit_applies_to_rpc_paths(mock_exchange_agent):
+    """Test a configured limiter does not disturb the happy path."""
+    configure_rate_limit(1000.0, burst=20)
+    try:
+        result = asyncio.run(_withdraw_from_l1(mock_exchange_agent, 25.0))
+    finally:
+        configure_rate_limit(None)
+
+    assert result is True
+    mock_exchange_agent.withdraw.assert_called_once_with(25000000, "USDC")
+
+
 def test_withdraw_from_l1_success(mock_exchange_agent):
     """Test successful withdrawal from L1."""
-    result = _withdraw_from_l1(mock_exchange_agent, 25.0)
+    result = asyncio.run(_withdraw_from_l1(mock_exchange_agent, 25.0))
 
     assert result is True
     mock_exchange_agent.withdraw.assert_called_once_with(25000000, "USDC")
@@ -585,7 +835,7 @@ def test_withdraw_from_l1_failure(mock_exchange_agent):
     """Test withdrawal from L1 failure."""
     mock_exchange_agent.withdraw.return_value = {"status": "error"}
 
-    result = _withdraw_from_l1(mock_exchange_agent, 25.0)
+    result = asyncio.run(_withdraw_from_l1(mock_exchange_agent, 25.0))
 
     assert result is False
 
@@ -594,13 +844,13 @@ def test_withdraw_from_l1_exception(mock_exchange_agent):
     """Test withdrawal from L1 when exception occurs."""
     mock_exchange_agent.withdraw.side_effect = Exception("API error")
 
-    result = _withdraw_from_l1(mock_exchange_agent, 25.0)
+    result = asyncio.run(_withdraw_from_l1(mock_exchange_agent, 25.0))
 
     assert result is False
 
 
-@patch('time.sleep')
-@patch('time.time')
+@patch('asyncio.sleep', new_callable=AsyncMock)
+@patch('airdrops.protocols.hyperliquid._monotonic')
 def test_poll_arbitrum_withdrawal_confirmation_success(
     mock_time, mock_sleep, mock_web3
 ):
@@ -613,19 +863,19 @@ def test_poll_arbitrum_withdrawal_confirmation_success(
         124000000,
     ]
 
-    result = _poll_arbitrum_withdrawal_confirmation(
+    result = asyncio.run(_poll_arbitrum_withdrawal_confirmation(
         mock_web3,
         "0x1234567890123456789012345678901234567890",
         25.0,
         10,
         300,
-    )
+    ))
 
     assert result is True
 
 
-@patch('time.sleep')
-@patch('time.time')
+@patch('asyncio.sleep', new_callable=AsyncMock)
+@patch('airdrops.protocols.hyperliquid._monotonic')
 def test_poll_arbitrum_withdrawal_confirmation_timeout(
     mock_time, mock_sleep, mock_web3
 ):
@@ -634,13 +884,13 @@ def test_poll_arbitrum_withdrawal_confirmation_timeout(
     mock_contract = mock_web3.eth.contract.return_value
     mock_contract.functions.balanceOf.return_value.call.return_value = 100000000
 
-    result = _poll_arbitrum_withdrawal_confirmation(
+    result = asyncio.run(_poll_arbitrum_withdrawal_confirmation(
         mock_web3,
         "0x1234567890123456789012345678901234567890",
         25.0,
         10,
         300,
-    )
+    ))
 
     assert result is False
 
@@ -690,7 +940,7 @@ def test_perform_random_onchain_vault_cycle(
         },
     }
 
-    with patch('time.sleep'):
+    with patch('asyncio.sleep', new_callable=AsyncMock):
         success, message = perform_random_onchain(
             mock_exchange_agent,
             mock_info_agent,
@@ -890,7 +1140,7 @@ def test_execute_vault_cycle_success(mock_exchange_agent, mock_info_agent):
         }
     }
 
-    with patch('time.sleep'):
+    with patch('asyncio.sleep', new_callable=AsyncMock):
         success, message = _execute_vault_cycle(
             mock_exchange_agent,
             mock_info_agent,
@@ -939,7 +1189,10 @@ def test_execute_evm_roundtrip_success(
         }
     }
 
-    with patch('airdrops.protocols.hyperliquid.evm_roundtrip', return_value=True):
+    with patch(
+        'airdrops.protocols.hyperliquid.evm_roundtrip',
+        new=AsyncMock(return_value=True),
+    ):
         success, message = _execute_evm_roundtrip(
             mock_exchange_agent,
             mock_info_agent,
@@ -1029,3 +1282,107 @@ def test_execute_query_clearing_house_state_exception(mock_info_agent):
 
     assert success is False
     assert "Error executing query_clearing_house_state" in message
+
+
+def test_run_fleet_caps_concurrency_and_collects_results():
+    """Test run_fleet bounds in-flight tasks and keeps result order."""
+    in_flight = 0
+    peak = 0
+
+    async def op(result):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    boom = ValueError("boom")
+    results = asyncio.run(
+        run_fleet([op(1), op(boom), op(3)], concurrency=2)
+    )
+
+    assert peak <= 2
+    assert results[0] == 1
+    assert results[1] is boom
+    assert results[2] == 3
+
+
+@patch('asyncio.sleep', new_callable=AsyncMock)
+@patch('airdrops.protocols.hyperliquid._monotonic')
+def test_poll_arbitrum_withdrawals_batch_success(mock_time, mock_sleep):
+    """Test batched withdrawal polling confirms wallets as they credit."""
+    from eth_abi import encode
+
+    def multicall_result(balances_units):
+        return encode(
+            ["(bool,bytes)[]"],
+            [[(True, encode(["uint256"], [u])) for u in balances_units]],
+        )
+
+    addr_a = "0x1234567890123456789012345678901234567890"
+    addr_b = "0x2222222222222222222222222222222222222222"
+    mock_w3 = Mock()
+    mock_w3.eth.call.side_effect = [
+        multicall_result([100_000_000, 50_000_000]),  # initial balances
+        multicall_result([124_000_000, 50_000_000]),  # A credited (25 - 1 fee)
+        multicall_result([79_000_000]),               # B credited (30 - 1 fee)
+    ]
+    mock_time.side_effect = iter([0, 10, 20, 30])
+
+    result = asyncio.run(_poll_arbitrum_withdrawals_batch(
+        mock_w3,
+        [(addr_a, 25.0), (addr_b, 30.0)],
+        poll_interval_seconds=10,
+        timeout_seconds=300,
+    ))
+
+    assert result == {addr_a: True, addr_b: True}
+    assert mock_w3.eth.call.call_count == 3
+
+
+def test_execute_query_bundle_caches_within_ttl(mock_info_agent):
+    """Test repeated read-only actions share one fetch of their view."""
+    address = "0x1234567890123456789012345678901234567890"
+
+    success, message = _execute_query_bundle(
+        mock_info_agent, address, "query_user_state"
+    )
+    assert success is True
+    assert "Successfully performed query_user_state" in message
+
+    success, message = _execute_query_bundle(
+        mock_info_agent, address, "query_user_state"
+    )
+    assert success is True
+
+    mock_info_agent.user_state.assert_called_once()
+
+
+def test_execute_query_bundle_fetches_only_requested_view(mock_info_agent):
+    """Test serving one action does not fetch the other views."""
+    address = "0x1234567890123456789012345678901234567890"
+
+    success, message = _execute_query_bundle(
+        mock_info_agent, address, "query_all_mids"
+    )
+    assert success is True
+    assert "Successfully performed query_all_mids" in message
+
+    mock_info_agent.all_mids.assert_called_once()
+    mock_info_agent.user_state.assert_not_called()
+    mock_info_agent.clearing_house_state.assert_not_called()
+    mock_info_agent.meta.assert_not_called()
+
+
+def test_execute_query_meta_cached_across_calls(mock_info_agent):
+    """Test repeated meta queries reuse the cached response until cleared."""
+    _execute_query_meta(mock_info_agent)
+    _execute_query_meta(mock_info_agent)
+    mock_info_agent.meta.assert_called_once()
+
+    clear_info_caches()
+    _execute_query_meta(mock_info_agent)
+    assert mock_info_agent.meta.call_count == 2
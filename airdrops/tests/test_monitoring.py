@@ -155,8 +155,7 @@ class TestMetricsCollector:
         mock_memory.return_value = mock_memory_obj
 
         mock_disk_obj = Mock()
-        mock_disk_obj.used = 500 * 1024**3  # 500GB
-        mock_disk_obj.total = 1000 * 1024**3  # 1TB
+        mock_disk_obj.percent = 50.0
         mock_disk.return_value = mock_disk_obj
 
         mock_net_obj = Mock()
@@ -175,9 +174,12 @@ class TestMetricsCollector:
         assert metrics.network_bytes_recv == 2048000
 
         # Verify Prometheus metrics were updated
-        assert collector.system_cpu_usage._value._value == 45.5
-        assert collector.system_memory_usage._value._value == 67.2
-        assert collector.system_disk_usage._value._value == 50.0
+        assert collector.registry.get_sample_value(
+            'system_cpu_usage_percent') == 45.5
+        assert collector.registry.get_sample_value(
+            'system_memory_usage_percent') == 67.2
+        assert collector.registry.get_sample_value(
+            'system_disk_usage_percent') == 50.0
 
     @patch('airdrops.monitoring.collector.psutil.cpu_percent')
     def test_collect_system_metrics_failure(self, mock_cpu):
@@ -186,8 +188,11 @@ class TestMetricsCollector:
 
         collector = MetricsCollector()
 
-        with pytest.raises(RuntimeError, match="System metrics collection failed"):
-            collector.collect_system_metrics()
+        metrics = collector.collect_system_metrics()
+
+        # Failure yields zeroed metrics instead of aborting the scrape
+        assert metrics.cpu_usage_percent == 0.0
+        assert metrics.memory_usage_percent == 0.0
 
     def test_collect_risk_manager_metrics_success(self):
         """Test successful risk manager metrics collection."""
@@ -236,8 +241,10 @@ class TestMetricsCollector:
 
         collector = MetricsCollector()
 
-        with pytest.raises(RuntimeError, match="Risk manager metrics collection failed"):
-            collector.collect_risk_manager_metrics(risk_manager)
+        metrics = collector.collect_risk_manager_metrics(risk_manager)
+
+        # Failure yields partial (empty) results instead of raising
+        assert metrics == {}
 
     def test_collect_capital_allocator_metrics_with_history(self):
         """Test capital allocator metrics collection with portfolio history."""
@@ -278,8 +285,9 @@ class TestMetricsCollector:
 
         collector = MetricsCollector()
 
-        with pytest.raises(RuntimeError, match="Capital allocator metrics collection failed"):
-            collector.collect_capital_allocator_metrics(allocator)
+        metrics = collector.collect_capital_allocator_metrics(allocator)
+
+        assert metrics == {}
 
     def test_collect_scheduler_metrics_success(self):
         """Test successful scheduler metrics collection."""
@@ -326,8 +334,9 @@ class TestMetricsCollector:
 
         collector = MetricsCollector()
 
-        with pytest.raises(RuntimeError, match="Scheduler metrics collection failed"):
-            collector.collect_scheduler_metrics(scheduler)
+        metrics = collector.collect_scheduler_metrics(scheduler)
+
+        assert metrics == {}
 
     @patch('airdrops.monitoring.collector.time.time')
     @patch.object(MetricsCollector, 'collect_system_metrics')
@@ -383,6 +392,24 @@ class TestMetricsCollector:
         assert 'capital_allocator' in metrics
         assert 'scheduler' in metrics
 
+    @patch.object(MetricsCollector, 'collect_system_metrics')
+    @patch.object(MetricsCollector, 'collect_risk_manager_metrics')
+    def test_collect_all_metrics_async(self, mock_risk, mock_system):
+        """Test the concurrent async collection variant."""
+        import asyncio
+
+        mock_system.return_value = SystemMetrics(50.0, 60.0, 30.0, 1000, 2000)
+        mock_risk.return_value = {'risk_level': 0}
+
+        collector = MetricsCollector()
+        metrics = asyncio.run(collector.collect_all_metrics_async(
+            risk_manager=MockRiskManager()
+        ))
+
+        assert 'collection_timestamp' in metrics
+        assert metrics['system']['cpu_usage_percent'] == 50.0
+        assert metrics['risk_manager'] == {'risk_level': 0}
+
     @patch.object(MetricsCollector, 'collect_system_metrics')
     def test_collect_all_metrics_failure(self, mock_system):
         """Test collect all metrics failure."""
@@ -398,8 +425,13 @@ class TestMetricsCollector:
         collector = MetricsCollector()
 
         # Set some metric values
-        collector.system_cpu_usage.set(45.5)
-        collector.system_memory_usage.set(67.2)
+        collector._system_collector.snapshot = SystemMetrics(
+            cpu_usage_percent=45.5,
+            memory_usage_percent=67.2,
+            disk_usage_percent=0.0,
+            network_bytes_sent=0,
+            network_bytes_recv=0
+        )
 
         prometheus_data = collector.export_prometheus_format()
 
@@ -432,7 +464,7 @@ class TestIntegration:
         # Setup system mocks
         mock_cpu.return_value = 45.5
         mock_memory.return_value = Mock(percent=67.2)
-        mock_disk.return_value = Mock(used=500*1024**3, total=1000*1024**3)
+        mock_disk.return_value = Mock(percent=50.0)
         mock_net.return_value = Mock(bytes_sent=1024000, bytes_recv=2048000)
 
         # Create components